@@ -4,7 +4,6 @@ from typing import List, Dict, Tuple, Optional
 from enum import Enum
 import streamlit as st
 from core.text_formatter import TextFormatter  # NEW IMPORT
-from core.session_manager import SessionManager
 
 class NumberingSystem(Enum):
     """Enumeration for chapter numbering systems"""
@@ -118,8 +117,7 @@ class ChapterUtils:
         if suffix and suffix.strip():
             result = f"{result}{suffix.strip()}"
         
-        # Apply font formatting - import here to avoid circular dependency
-        from core.text_formatter import TextFormatter
+        # Apply font formatting
         return TextFormatter.format_text(result, font_case)
 
 
@@ -266,8 +264,6 @@ class ChapterUtils:
         """
         Generate NULL sequence chapter name: "Name", "Name (1)", "Name (2)", etc.
         """
-        from core.text_formatter import TextFormatter
-        
         if chapter_index == 0:
             base_name = "Name"
         else:
@@ -385,6 +381,22 @@ class ChapterConfigManager:
 class PartManager:
     """Manages part creation and deletion operations"""
     
+    # Part ID slug: spaces and hyphens become underscores in one translate pass
+    PART_ID_TABLE = str.maketrans(' -', '__')
+    
+    @staticmethod
+    def generate_part_id(formatted_part_name: str, custom_parts: Dict) -> str:
+        """Build a part ID from the formatted name that is not yet used in custom_parts"""
+        part_id = f"part_{len(custom_parts) + 1}_{formatted_part_name.lower().translate(PartManager.PART_ID_TABLE)}"
+        
+        # Ensure unique ID
+        counter = 1
+        original_id = part_id
+        while part_id in custom_parts:
+            part_id = f"{original_id}_{counter}"
+            counter += 1
+        return part_id
+    
     @staticmethod
     def add_part_with_immediate_sync(config: Dict, part_name: str) -> bool:
         """
@@ -392,7 +404,6 @@ class PartManager:
         """
         try:
             from core.folder_manager import FolderManager
-            from core.text_formatter import TextFormatter  # Add this import
             from pathlib import Path
             from datetime import datetime
             
@@ -402,9 +413,8 @@ class PartManager:
             font_case = SessionManager.get_font_case()
             formatted_part_name = TextFormatter.format_part_name(part_name, font_case)
             
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             # Path resolution
             current_dir = Path.cwd()
@@ -434,15 +444,7 @@ class PartManager:
             
             # Update session state immediately with formatted name
             custom_parts = SessionManager.get('custom_parts', {})
-            base_id = formatted_part_name.lower().replace(' ', '_').replace('-', '_')
-            part_id = f"part_{len(custom_parts) + 1}_{base_id}"
-            
-            # Ensure unique ID
-            counter = 1
-            original_id = part_id
-            while part_id in custom_parts:
-                part_id = f"{original_id}_{counter}"
-                counter += 1
+            part_id = PartManager.generate_part_id(formatted_part_name, custom_parts)
             
             custom_parts[part_id] = {
                 'name': formatted_part_name,  # Use formatted name
@@ -1,5 +1,6 @@
 # core/folder_manager.py - Modified to support standalone chapters
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 import streamlit as st
@@ -62,8 +63,9 @@ class FolderManager:
     ]
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def sanitize_name(name: str) -> str:
-        """Sanitize name for folder creation"""
+        """Sanitize name for folder creation (pure, so memoized for repeated rerun inputs)"""
         # Replace problematic characters
         invalid_chars = '<>:"/\\|?*'
         for char in invalid_chars:
@@ -75,6 +77,13 @@ class FolderManager:
         
         return name[:50]  # Limit length
     
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_base_name(code: str, book_name: str) -> Tuple[str, str]:
+        """Get (safe_code, base_name) for a project, memoized since every page render derives it"""
+        safe_code = FolderManager.sanitize_name(code)
+        return safe_code, f"{safe_code}_{book_name}"
+    
     
 
     @staticmethod
@@ -96,8 +105,7 @@ class FolderManager:
             formatted_book_name = TextFormatter.format_book_name(book_name, font_case)
             
             # Sanitize the code but keep book name as-is with only font formatting
-            safe_code = FolderManager.sanitize_name(formatted_code)
-            base_name = f"{safe_code}_{formatted_book_name}"
+            safe_code, base_name = FolderManager.get_base_name(formatted_code, formatted_book_name)
             
             # Get project destination - if set, use it; otherwise use current directory
             project_destination = SessionManager.get_project_destination()
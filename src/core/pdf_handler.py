@@ -1,10 +1,26 @@
 import PyPDF2
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 import streamlit as st
-from typing import Tuple, Optional, List
+from typing import Callable, Tuple, Optional, List
 from pathlib import Path
 import os
 
+
+def _open_pdf_reader(pdf_digest: str, pdf_content: bytes) -> PyPDF2.PdfReader:
+    """
+    Parse the PDF once per content digest. The reader is kept per session: PdfReader seeks one
+    shared stream and fills its caches lazily, so it must not be shared across sessions.
+    """
+    cached = st.session_state.get('pdf_reader_cache')
+    if cached is None or cached[0] != pdf_digest:
+        cached = (pdf_digest, PyPDF2.PdfReader(BytesIO(pdf_content)))
+        st.session_state['pdf_reader_cache'] = cached
+    return cached[1]
+
+
 class PDFHandler:
     """Handles PDF file operations"""
     
@@ -30,7 +46,10 @@ class PDFHandler:
                 st.error("PDF file appears to be empty or corrupted")
                 return None, 0
             
-            pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
+            # Parse through the digest-keyed cache so extraction (and re-uploads of the
+            # same file) reuse this reader instead of parsing the PDF again
+            pdf_digest = hashlib.sha256(file_content).hexdigest()
+            pdf_reader = _open_pdf_reader(pdf_digest, file_content)
             total_pages = len(pdf_reader.pages)
             
             # Store file content in session state for ALL files
@@ -48,6 +67,7 @@ class PDFHandler:
             
             # Also store file name for reference
             st.session_state.pdf_file_name = uploaded_file.name
+            st.session_state.pdf_content_digest = pdf_digest
             
             return pdf_reader, total_pages
             
@@ -62,7 +82,11 @@ class PDFHandler:
             # Always try to get from stored content first
             pdf_content = st.session_state.get('pdf_content')
             if pdf_content:
-                return PyPDF2.PdfReader(BytesIO(pdf_content))
+                pdf_digest = st.session_state.get('pdf_content_digest')
+                if not pdf_digest:
+                    pdf_digest = hashlib.sha256(pdf_content).hexdigest()
+                    st.session_state.pdf_content_digest = pdf_digest
+                return _open_pdf_reader(pdf_digest, pdf_content)
             
             # Fallback: try to get from uploaded file (may not work for large files)
             pdf_file = st.session_state.get('pdf_file')
@@ -103,11 +127,19 @@ class PDFHandler:
 class PDFExtractor:
     """Handles PDF page extraction and file creation"""
     
+    # Single-page writers prepared per worker thread before each batch of writes
+    WRITE_BATCH_PER_WORKER = 4
+    
     @staticmethod
     def extract_pages_to_folder(page_ranges: List[str], destination_folder: str, 
-                            naming_base: str, total_pages: int) -> Tuple[bool, List[str], str]:
+                            naming_base: str, total_pages: int,
+                            pdf_reader: Optional[PyPDF2.PdfReader] = None,
+                            progress_callback: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, List[Tuple[str, str]], str]:
         """
         Extract specified pages from PDF and save to destination folder with sequential numbering
+        
+        Returns:
+            Tuple of (success, created (full path, file name) pairs, error message)
         """
         try:
             # Parse page ranges into individual page numbers
@@ -116,20 +148,11 @@ class PDFExtractor:
             if not pages_to_extract:
                 return False, [], "No valid pages specified"
             
-            # Get PDF reader
-            pdf_reader = PDFHandler.get_pdf_reader()
+            # Get PDF reader (cached per uploaded file)
+            if pdf_reader is None:
+                pdf_reader = PDFHandler.get_pdf_reader()
             if not pdf_reader:
-                pdf_content = st.session_state.get('pdf_content')
-                if pdf_content:
-                    try:
-                        from io import BytesIO
-                        import PyPDF2
-                        pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_content))
-                    except Exception as e:
-                        return False, [], f"Could not access PDF file: {str(e)}"
-                
-                if not pdf_reader:
-                    return False, [], "Could not access PDF file. Please re-upload your PDF."
+                return False, [], "Could not access PDF file. Please re-upload your PDF."
             
             # Use the destination_folder exactly as provided
             dest_path = Path(destination_folder)
@@ -137,19 +160,9 @@ class PDFExtractor:
             # Create destination folder if it doesn't exist
             dest_path.mkdir(parents=True, exist_ok=True)
             
-            created_files = []
-            failed_pages = []
-            
-            # Extract each page
-            for idx, (sequential_num, actual_page_num) in enumerate(enumerate(pages_to_extract, 1)):
-                success, file_path = PDFExtractor.extract_single_page(
-                    pdf_reader, actual_page_num, dest_path, naming_base, sequential_num
-                )
-                
-                if success:
-                    created_files.append(file_path)
-                else:
-                    failed_pages.append(actual_page_num)
+            created_files, failed_pages = PDFExtractor.write_pages(
+                pdf_reader, pages_to_extract, dest_path, naming_base, progress_callback
+            )
             
             # Report results
             if failed_pages:
@@ -164,52 +177,76 @@ class PDFExtractor:
 
     
     @staticmethod
-    def extract_single_page(pdf_reader: PyPDF2.PdfReader, actual_page_num: int, 
-                        dest_path: Path, naming_base: str, sequential_page_num: int = None) -> Tuple[bool, str]:
+    def write_pages(pdf_reader: PyPDF2.PdfReader, pages_to_extract: List[int],
+                    dest_path: Path, naming_base: str,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Tuple[List[Tuple[str, str]], List[int]]:
         """
-        Extract a single page from PDF with proper naming convention and correct spacing
+        Write each page of an already opened PDF to its own file with sequential numbering
+        
+        Writers are built on the calling thread (add_page clones the page out of the reader),
+        a bounded batch at a time, so only the independent file writes run on the thread pool.
+        progress_callback(done, total) is invoked on the calling thread as each write finishes.
+        
+        Returns:
+            Tuple of (created (full path, file name) pairs, page numbers that failed)
         """
+        from core.text_formatter import TextFormatter
+        font_case = st.session_state.get('selected_font_case', 'First Capital (Title Case)')
+        formatted_page_text = TextFormatter.format_text("Page", font_case)
+        
+        created_files = []
+        failed_pages = []
+        total_pages = len(pdf_reader.pages)
+        max_workers = min(8, os.cpu_count() or 1, max(len(pages_to_extract), 1))
+        # Writers hold a copy of their page, so only a bounded batch is built ahead of the writes
+        batch_size = max_workers * PDFExtractor.WRITE_BATCH_PER_WORKER
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch_start in range(0, len(pages_to_extract), batch_size):
+                jobs = []
+                for sequential_num, actual_page_num in enumerate(
+                        pages_to_extract[batch_start:batch_start + batch_size], batch_start + 1):
+                    if actual_page_num < 1 or actual_page_num > total_pages:
+                        failed_pages.append(actual_page_num)
+                        if progress_callback:
+                            progress_callback(len(created_files) + len(failed_pages), len(pages_to_extract))
+                        continue
+                    
+                    pdf_writer = PyPDF2.PdfWriter()
+                    pdf_writer.add_page(pdf_reader.pages[actual_page_num - 1])
+                    
+                    formatted_page_num = TextFormatter.format_text(str(sequential_num), font_case)
+                    file_path = dest_path / f"{naming_base}_{formatted_page_text} {formatted_page_num}.pdf"
+                    jobs.append((actual_page_num, pdf_writer, file_path))
+                
+                # map keeps results in page order; no Streamlit calls happen on worker threads
+                for actual_page_num, created_file, error in executor.map(PDFExtractor._write_page_file, jobs):
+                    if error:
+                        st.error(f"Error extracting page {actual_page_num}: {error}")
+                        failed_pages.append(actual_page_num)
+                    else:
+                        created_files.append(created_file)
+                    
+                    if progress_callback:
+                        progress_callback(len(created_files) + len(failed_pages), len(pages_to_extract))
+        
+        return created_files, failed_pages
+    
+    @staticmethod
+    def _write_page_file(job: Tuple[int, PyPDF2.PdfWriter, Path]) -> Tuple[int, Optional[Tuple[str, str]], str]:
+        """Write one prepared single-page PDF; runs on a worker thread"""
+        actual_page_num, pdf_writer, file_path = job
         try:
-            # Validate page number
-            if actual_page_num < 1 or actual_page_num > len(pdf_reader.pages):
-                return False, f"Page {actual_page_num} out of range"
-            
-            # Create new PDF with single page
-            pdf_writer = PyPDF2.PdfWriter()
-            pdf_writer.add_page(pdf_reader.pages[actual_page_num - 1])
-            
-            # Use sequential numbering if provided, otherwise use actual page number
-            page_num_for_filename = sequential_page_num if sequential_page_num is not None else actual_page_num
-            
-            # Apply font formatting to both "Page" text and page number
-            import streamlit as st
-            from core.text_formatter import TextFormatter
-            font_case = st.session_state.get('selected_font_case', 'First Capital (Title Case)')
-            
-            # Format "Page" text
-            formatted_page_text = TextFormatter.format_text("Page", font_case)
-            # Format page number
-            formatted_page_num = TextFormatter.format_text(str(page_num_for_filename), font_case)
-            
-            # Generate file name with formatted "Page" text and number
-            file_name = f"{naming_base}_{formatted_page_text} {formatted_page_num}.pdf"
-            
-            # Use the exact dest_path provided
-            file_path = dest_path / file_name
-            
-            # Write PDF file
             with open(file_path, 'wb') as output_file:
                 pdf_writer.write(output_file)
-            
-            return True, str(file_path.absolute())
-            
+            return actual_page_num, (str(file_path.absolute()), file_path.name), ""
         except Exception as e:
-            st.error(f"Error extracting page {actual_page_num}: {str(e)}")
-            return False, ""
-
+            return actual_page_num, None, str(e)
+    
     @staticmethod
+    @lru_cache(maxsize=256)
     def sanitize_filename(filename: str) -> str:
-        """Sanitize filename for cross-platform compatibility"""
+        """Sanitize filename for cross-platform compatibility (pure, so memoized)"""
         # Remove/replace problematic characters
         invalid_chars = '<>:"/\\|?*'
         for char in invalid_chars:
@@ -231,7 +268,9 @@ class PDFExtractor:
         Returns:
             List of individual page numbers
         """
-        pages = set()
+        # Collect validated (start, end) intervals; they are merged at the end instead of
+        # expanding every range into a set that then has to be sorted page by page
+        intervals = []
         
         for range_str in page_ranges:
             range_str = range_str.strip()
@@ -252,7 +291,7 @@ class PDFExtractor:
                     
                     # Validate range
                     if start_page > 0 and end_page <= total_pages and start_page <= end_page:
-                        pages.update(range(start_page, end_page + 1))
+                        intervals.append((start_page, end_page))
                     else:
                         st.warning(f"Invalid range: {range_str} (PDF has {total_pages} pages)")
                         
@@ -263,14 +302,22 @@ class PDFExtractor:
                 try:
                     page_num = int(range_str)
                     if 1 <= page_num <= total_pages:
-                        pages.add(page_num)
+                        intervals.append((page_num, page_num))
                     else:
                         st.warning(f"Page {page_num} out of range (1-{total_pages})")
                         
                 except ValueError:
                     st.warning(f"Invalid page number: {range_str}")
         
-        return sorted(list(pages))
+        intervals.sort()
+        pages = []
+        last_page = 0
+        for start_page, end_page in intervals:
+            if end_page > last_page:
+                pages.extend(range(max(start_page, last_page + 1), end_page + 1))
+                last_page = end_page
+        
+        return pages
     
     @staticmethod
     def preview_page_extraction(page_ranges: List[str], total_pages: int) -> str:
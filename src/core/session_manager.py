@@ -1,11 +1,16 @@
 # core/session_manager.py - Modified to avoid circular imports
 
+import os
 import streamlit as st
-from typing import Dict, Any
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, List
 
 class SessionManager:
     """Manages application session state"""
     
+    EXTRACTION_HISTORY_LIMIT = 200
+    
     @staticmethod
     def initialize_session():
         """Initialize session state with default values"""
@@ -22,7 +27,9 @@ class SessionManager:
             'current_step': 1,
             'chapters_created': False,
             'page_assignments': {},
-            'extraction_history': [],
+            'extraction_history': deque(maxlen=SessionManager.EXTRACTION_HISTORY_LIMIT),
+            'extraction_count': 0,
+            'extraction_total_pages': 0,
             'folder_metadata': {},
             'unique_chapter_counter': 0,
             'numbering_systems': {},
@@ -59,10 +66,121 @@ class SessionManager:
         """Get value from session state"""
         return st.session_state.get(key, default)
     
+    @staticmethod
+    def snapshot(defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Get several values at once, as {key: value}, falling back to each key's default"""
+        state = st.session_state
+        return {key: state.get(key, default) for key, default in defaults.items()}
+    
     @staticmethod
     def set(key: str, value: Any):
         """Set value in session state"""
         st.session_state[key] = value
+        SessionManager._sync_derived_state({key: value})
+    
+    @staticmethod
+    def bulk_set(values: Dict[str, Any]):
+        """Set several values at once (e.g. when loading a project), updating derived state once"""
+        st.session_state.update(values)
+        SessionManager._sync_derived_state(values)
+    
+    @staticmethod
+    def _sync_derived_state(values: Dict[str, Any]):
+        """Refresh the indexes and counters derived from the keys just set"""
+        if 'folder_metadata' in values:
+            # Generation counter lets readers cache derived views without hashing the metadata
+            st.session_state['folder_metadata_version'] = st.session_state.get('folder_metadata_version', 0) + 1
+            SessionManager._index_folder_metadata(values['folder_metadata'])
+        if 'extraction_history' in values:
+            # Saved projects carry the running totals, which also count records the capped
+            # history has dropped; only older save files need them recomputed
+            has_totals = 'extraction_count' in values and 'extraction_total_pages' in values
+            SessionManager._reset_extraction_history(values['extraction_history'], recount=not has_totals)
+    
+    @staticmethod
+    def record_extraction(record: Dict[str, Any]):
+        """Append an extraction record to the capped history and update the running totals"""
+        history = st.session_state.get('extraction_history')
+        if not isinstance(history, deque):
+            history = SessionManager._reset_extraction_history(history or [])
+        history.append(record)
+        st.session_state['extraction_count'] = st.session_state.get('extraction_count', 0) + 1
+        st.session_state['extraction_total_pages'] = (
+            st.session_state.get('extraction_total_pages', 0) + record['pages_extracted']
+        )
+    
+    @staticmethod
+    def _reset_extraction_history(records, recount: bool = True) -> deque:
+        """Store extraction history as a capped deque and, if asked, recompute totals from its records"""
+        records = list(records)
+        history = deque(records, maxlen=SessionManager.EXTRACTION_HISTORY_LIMIT)
+        st.session_state['extraction_history'] = history
+        if recount:
+            st.session_state['extraction_count'] = len(records)
+            st.session_state['extraction_total_pages'] = sum(record['pages_extracted'] for record in records)
+        return history
+    
+    @staticmethod
+    def get_folder_index() -> Dict[str, Any]:
+        """Get the folder metadata index, rebuilding it if it is missing (e.g. after a session clear)"""
+        index = st.session_state.get('folder_metadata_index')
+        if index is None:
+            index = SessionManager._index_folder_metadata(st.session_state.get('folder_metadata', {}))
+        return index
+    
+    @staticmethod
+    def _index_folder_metadata(folder_metadata: Dict[str, Dict]) -> Dict[str, Any]:
+        """
+        Rebuild the per-type folder index at write time so readers never rescan folder_metadata
+        
+        Returns:
+            Dict with 'chapters_by_part' (part number -> chapter ids, already in display order),
+            'custom_by_part' (part number -> folder ids), 'custom_folders' (folder ids)
+            and 'id_by_path' (actual path -> folder id)
+        """
+        chapters_by_part: Dict[int, List[str]] = {}
+        custom_by_part: Dict[int, List[str]] = {}
+        custom_folders: List[str] = []
+        id_by_path: Dict[str, str] = {}
+        
+        for folder_id, metadata in folder_metadata.items():
+            if metadata.get('actual_path'):
+                id_by_path.setdefault(metadata['actual_path'], folder_id)
+            folder_type = metadata.get('type')
+            if folder_type == 'chapter' and metadata.get('parent_part') is not None:
+                chapters_by_part.setdefault(metadata['parent_part'], []).append(folder_id)
+            elif folder_type == 'custom':
+                custom_folders.append(folder_id)
+                if metadata.get('parent_part') is not None:
+                    custom_by_part.setdefault(metadata['parent_part'], []).append(folder_id)
+        
+        # Sort once here rather than on every read
+        for part_number, chapter_ids in chapters_by_part.items():
+            chapter_ids.sort(key=lambda folder_id: SessionManager._chapter_sort_key(folder_metadata[folder_id], part_number))
+        
+        index = {
+            'chapters_by_part': chapters_by_part,
+            'custom_by_part': custom_by_part,
+            'custom_folders': custom_folders,
+            'id_by_path': id_by_path
+        }
+        st.session_state['folder_metadata_index'] = index
+        return index
+    
+    @staticmethod
+    def _chapter_sort_key(metadata: Dict, part_number: int) -> tuple:
+        """Sort numeric chapters first, then null-sequence chapters, then everything else"""
+        chapter_num = metadata.get('chapter_number', '')
+        if isinstance(chapter_num, str):
+            if chapter_num.isdigit():
+                return (0, int(chapter_num))
+            if not chapter_num.startswith('null_'):
+                return (2, chapter_num)
+            null_index = chapter_num.rpartition('_')[2]
+            if null_index.isdigit():
+                return (1, int(null_index))
+        # Unparseable numbers fall back to the display name
+        return (3, metadata.get('folder_name', '').replace(f"_Part_{part_number}_Chapter_", "Chapter "))
     
     @staticmethod
     def update_config(updates: Dict[str, Any]):
@@ -113,6 +231,34 @@ class SessionManager:
         """Get project destination folder"""
         return st.session_state.get('project_destination_folder', '')
 
+    @staticmethod
+    def get_project_path(base_name: str) -> Path:
+        """
+        Get the project folder under the project destination (or the working directory),
+        creating it if missing. The path is resolved once per session and destination.
+        """
+        project_destination = SessionManager.get_project_destination()
+        cache_key = (project_destination, base_name)
+        resolved_paths = st.session_state.setdefault('resolved_project_paths', {})
+        project_path = resolved_paths.get(cache_key)
+        if project_path is not None:
+            # The folder may have been deleted or moved since it was resolved
+            if not project_path.is_dir():
+                project_path.mkdir(parents=True, exist_ok=True)
+            return project_path
+        
+        if project_destination and os.path.exists(project_destination):
+            base_path = Path(project_destination)
+        else:
+            base_path = Path.cwd()
+        
+        project_path = base_path / base_name
+        if not project_path.is_dir():
+            project_path.mkdir(parents=True, exist_ok=True)
+        
+        resolved_paths[cache_key] = project_path
+        return project_path
+
     @staticmethod
     def set_project_destination(folder_path: str):
         """Set project destination folder"""
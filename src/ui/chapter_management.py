@@ -25,9 +25,8 @@ class ChapterOperations:
             chapter_index: Index of chapter in list (used when create_only=True)
         """
         try:
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             project_destination = SessionManager.get_project_destination()
             if project_destination and os.path.exists(project_destination):
@@ -96,9 +95,8 @@ class ChapterOperations:
             chapter = chapters[chapter_index]
             
             # Build chapter folder path
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             # Get project path
             project_destination = SessionManager.get_project_destination()
@@ -317,9 +315,8 @@ def add_individual_custom_part(config: Dict, part_name: str):
         font_case = SessionManager.get_font_case()
         formatted_part_name = TextFormatter.format_part_name(part_name, font_case)
         
-        safe_code = FolderManager.sanitize_name(config['code'])
         book_name = config['book_name']
-        base_name = f"{safe_code}_{book_name}"
+        safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
         
         # Use project destination instead of current directory
         project_destination = SessionManager.get_project_destination()
@@ -345,15 +342,7 @@ def add_individual_custom_part(config: Dict, part_name: str):
         
         # Rest remains the same...
         custom_parts = SessionManager.get('custom_parts', {})
-        base_id = formatted_part_name.lower().replace(' ', '_').replace('-', '_')
-        part_id = f"part_{len(custom_parts) + 1}_{base_id}"
-        
-        # Ensure unique ID
-        counter = 1
-        original_id = part_id
-        while part_id in custom_parts:
-            part_id = f"{original_id}_{counter}"
-            counter += 1
+        part_id = PartManager.generate_part_id(formatted_part_name, custom_parts)
         
         custom_parts[part_id] = {
             'name': formatted_part_name,
@@ -451,9 +440,8 @@ def render_chapter_details_optimized(context_key: str, chapters: List[Dict], con
     from core.text_formatter import TextFormatter
     font_case = st.session_state.get('selected_font_case', 'First Capital (Sentence case)')
     
-    safe_code = FolderManager.sanitize_name(config['code'])
     book_name = config['book_name']
-    base_name = f"{safe_code}_{book_name}"
+    safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
     
     # Check which chapters already have folders created
     created_chapter_indices = get_created_chapter_indices(config, context_key, chapters, is_standalone)
@@ -577,9 +565,8 @@ def render_chapter_details_optimized(context_key: str, chapters: List[Dict], con
 def update_chapter_in_backend(config: Dict, context_key: str, chapter_index: int, old_folder_name: str, new_folder_name: str, is_standalone: bool, new_number: str, new_name: str) -> bool:
     """Update chapter folder in backend when any field changes"""
     try:
-        safe_code = FolderManager.sanitize_name(config['code'])
         book_name = config['book_name']
-        base_name = f"{safe_code}_{book_name}"
+        safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
         
         # Get project path
         project_destination = SessionManager.get_project_destination()
@@ -673,9 +660,8 @@ def get_created_chapter_indices(config: Dict, context_key: str, chapters: List[D
     """Check which chapter folders actually exist on filesystem"""
     created_indices = set()
     
-    safe_code = FolderManager.sanitize_name(config['code'])
     book_name = config['book_name']
-    base_name = f"{safe_code}_{book_name}"
+    safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
     
     project_destination = SessionManager.get_project_destination()
     if project_destination and os.path.exists(project_destination):
@@ -810,9 +796,8 @@ def render_chapter_preview(config: Dict):
         st.info("Configure chapters to see preview")
         return
     
-    safe_code = FolderManager.sanitize_name(config['code'])
     book_name = config['book_name']
-    base_name = f"{safe_code}_{book_name}"
+    safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
     
     # Show standalone chapters first
     if standalone_chapters:
@@ -845,9 +830,8 @@ def get_existing_custom_parts(config: Dict) -> List[Dict]:
     """Get list of actually existing custom parts by checking filesystem first, then session state"""
     existing_parts = []
     
-    safe_code = FolderManager.sanitize_name(config.get('code', ''))
     book_name = config.get('book_name', '')
-    base_name = f"{safe_code}_{book_name}"
+    safe_code, base_name = FolderManager.get_base_name(config.get('code', ''), book_name)
     
     # Get custom parts from session state
     custom_parts = SessionManager.get('custom_parts', {})
@@ -883,9 +867,8 @@ def get_existing_custom_parts(config: Dict) -> List[Dict]:
 def delete_individual_custom_part(config: Dict, part_name: str):
     """Delete an individual custom part folder and all its contents"""
     try:
-        safe_code = FolderManager.sanitize_name(config['code'])
         book_name = config['book_name']
-        base_name = f"{safe_code}_{book_name}"
+        safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
         
         # Use project destination instead of current directory
         project_destination = SessionManager.get_project_destination()
@@ -993,9 +976,8 @@ def create_standalone_chapters(config: Dict, chapters: List[Dict]):
     
     try:
         with st.spinner("Creating standalone chapters..."):
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             # Use project destination instead of current directory
             project_destination = SessionManager.get_project_destination()
@@ -1043,9 +1025,8 @@ def update_existing_standalone_chapters(config: Dict, chapters: List[Dict]):
     """Update existing standalone chapters in backend"""
     try:
         with st.spinner("Updating standalone chapters..."):
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             # Get project path
             project_destination = SessionManager.get_project_destination()
@@ -1197,9 +1178,8 @@ def create_chapters_for_custom_part(config: Dict, part_name: str, chapters: List
     
     try:
         with st.spinner(f"Creating chapters for {part_name}..."):
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             # Use project destination instead of current directory
             project_destination = SessionManager.get_project_destination()
@@ -1250,9 +1230,8 @@ def create_all_chapters(config: Dict, chapters_config: Dict):
     
     try:
         with st.spinner("Creating chapter folders..."):
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             # Use project destination instead of current directory
             project_destination = SessionManager.get_project_destination()
@@ -1308,9 +1287,8 @@ def update_existing_chapters_for_part(config: Dict, part_name: str, chapters: Li
     """Update existing chapters for a specific custom part"""
     try:
         with st.spinner(f"Updating chapters for {part_name}..."):
-            safe_code = FolderManager.sanitize_name(config['code'])
             book_name = config['book_name']
-            base_name = f"{safe_code}_{book_name}"
+            safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
             
             # Get project path
             project_destination = SessionManager.get_project_destination()
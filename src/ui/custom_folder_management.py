@@ -2,16 +2,13 @@
 import streamlit as st
 from typing import Dict, List, Optional
 from pathlib import Path
+import os
 
 from core.session_manager import SessionManager
-import os
 
 def render_custom_folder_management_page():
     """Render the custom folder management page"""
     
-    # Import at function level to avoid circular imports
-    from core.session_manager import SessionManager
-    
     # Check prerequisites
     if not SessionManager.get('folder_structure_created'):
         render_prerequisites_warning()
@@ -80,7 +77,7 @@ def render_custom_folder_creation_interface():
         st.info(f"📁 Parent folder: **{parent_name}**")
         
         # Use session state to track the input value with unique key
-        folder_input_key = f"custom_folder_name_{hash(selected_parent_path) % 10000}"
+        folder_input_key = f"custom_folder_name_{selected_parent_path}"
         
         custom_folder_name = st.text_input(
             "Custom Folder Name",
@@ -102,7 +99,7 @@ def render_custom_folder_creation_interface():
             st.code(f"📁 {parent_name} → {final_folder_name}")
             
             # Create button with unique key
-            create_button_key = f"create_folder_{hash(selected_parent_path + final_folder_name) % 10000}"
+            create_button_key = f"create_folder_{selected_parent_path}"
             if st.button("🏗️ Create Custom Folder", type="primary", key=create_button_key):
                 success = create_custom_folder_simple(selected_parent_path, final_folder_name)
                 if success:
@@ -114,7 +111,6 @@ def render_project_folder_dropdown() -> Optional[str]:
     """Render dropdown for project folder selection"""
     
     # Import at function level to avoid circular imports
-    from core.session_manager import SessionManager
     from core.folder_manager import FolderManager
     
     config = SessionManager.get('project_config', {})
@@ -122,9 +118,8 @@ def render_project_folder_dropdown() -> Optional[str]:
         st.error("Project configuration missing.")
         return None
     
-    safe_code = FolderManager.sanitize_name(config['code'])
     book_name = config['book_name']
-    base_name = f"{safe_code}_{book_name}"
+    safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
     
     # Get project path
     project_path = get_project_path(base_name)
@@ -140,38 +135,24 @@ def render_project_folder_dropdown() -> Optional[str]:
         st.info("No folders found in the project.")
         return None
     
-    # Create folder dropdown options
-    folder_options = []
-    folder_paths = []
-    
-    # Add project root as an option
-    folder_options.append(f"📂 {project_path.name} (Project Root)")
-    folder_paths.append(str(project_path.absolute()))
+    # Create folder dropdown options keyed by path, so the selection follows the folder
+    # rather than its position when folders are added
+    project_root = str(project_path.absolute())
+    folder_choices = {project_root: f"📂 {project_path.name} (Project Root)"}
     
     # Add all subfolders with proper hierarchy display
-    for folder_info in available_folders:
-        folder_path, relative_path, depth = folder_info
+    for folder_path, relative_path, depth in available_folders:
         indent = "  " * depth
         folder_icon = "📁" if depth == 0 else "└─"
-        folder_name = Path(folder_path).name
-        display_name = f"{indent}{folder_icon} {folder_name}"
-        folder_options.append(display_name)
-        folder_paths.append(folder_path)
-    
-    # Use selectbox with dynamic key based on folder count
-    selector_key = f"parent_folder_selector_{len(folder_options)}_{hash(str(folder_options)) % 10000}"
-    selected_index = st.selectbox(
+        folder_choices[folder_path] = f"{indent}{folder_icon} {os.path.basename(folder_path)}"
+    
+    return st.selectbox(
         "Choose parent folder:",
-        range(len(folder_options)),
-        format_func=lambda x: folder_options[x],
+        list(folder_choices),
+        format_func=folder_choices.__getitem__,
         help="Select the folder where you want to create the custom folder",
-        key=selector_key
+        key=f"parent_folder_selector_{project_root}"
     )
-    
-    if selected_index is not None:
-        return folder_paths[selected_index]
-    
-    return None
 
 def get_all_project_folders_fresh(project_path: Path) -> List[tuple]:
     """Get all folders within the project directory - fresh scan every time"""
@@ -179,30 +160,31 @@ def get_all_project_folders_fresh(project_path: Path) -> List[tuple]:
     folders = []
     
     try:
-        # Get all directories, excluding the project root itself
-        for item in project_path.rglob('*'):
-            if item.is_dir() and item != project_path:
-                relative_path = item.relative_to(project_path)
-                depth = len(relative_path.parts) - 1
-                folders.append((str(item.absolute()), str(relative_path), depth))
+        # Get all directories, excluding the project root itself (a scandir walk never repeats a path)
+        folders = list(walk_project_folders(os.path.abspath(project_path)))
         
         # Sort by depth first, then by path for consistent ordering
         folders.sort(key=lambda x: (x[2], x[1]))
         
-        # Remove duplicates if any
-        seen_paths = set()
-        unique_folders = []
-        for folder_path, rel_path, depth in folders:
-            if folder_path not in seen_paths:
-                seen_paths.add(folder_path)
-                unique_folders.append((folder_path, rel_path, depth))
-        
-        return unique_folders
+        return folders
     
     except Exception as e:
         st.error(f"Error scanning folders: {str(e)}")
         return []
 
+def walk_project_folders(dir_path: str, relative_prefix: str = "", depth: int = 0):
+    """Yield (absolute path, path relative to the walk root, depth) for every subfolder"""
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                relative_path = os.path.join(relative_prefix, entry.name)
+                yield entry.path, relative_path, depth
+                try:
+                    yield from walk_project_folders(entry.path, relative_path, depth + 1)
+                except OSError:
+                    # An unreadable subfolder is still listed; only its contents are skipped
+                    continue
+
 def render_custom_path_input() -> Optional[str]:
     """Render custom path input"""
     
@@ -288,40 +270,9 @@ def create_custom_folder_simple(parent_path: str, folder_name: str) -> bool:
         return False
     
 
-def add_folder_to_metadata(folder_path: str, folder_name: str, parent_path: str, original_name: str = None):
-    """Add folder to metadata tracking - FIXED signature"""
-    
-    folder_metadata = SessionManager.get('folder_metadata', {})
-    import random
-    custom_folder_id = f"custom_{random.randint(10000, 99999)}"
-    
-    parent_name = Path(parent_path).name
-    display_original_name = original_name or folder_name
-    
-    folder_metadata[custom_folder_id] = {
-        'display_name': f"{parent_name} → {display_original_name}",
-        'actual_path': folder_path,
-        'type': 'custom',
-        'parent_path': parent_path,
-        'folder_name': folder_name,  # Full name with prefix and formatting
-        'naming_base': folder_name,   # Use full formatted name for file naming
-        'original_name': original_name  # Keep original input
-    }
-    
-    SessionManager.set('folder_metadata', folder_metadata)
-    
-    # Update created folders list
-    current_folders = SessionManager.get('created_folders', [])
-    if folder_path not in current_folders:
-        current_folders.append(folder_path)
-        SessionManager.set('created_folders', current_folders)
-
 def add_folder_to_metadata(folder_path: str, folder_name: str, parent_path: str, original_name: str = None):
     """Add folder to metadata tracking"""
     
-    # Import at function level to avoid circular imports
-    from core.session_manager import SessionManager
-    
     folder_metadata = SessionManager.get('folder_metadata', {})
     import random
     custom_folder_id = f"custom_{random.randint(10000, 99999)}"
@@ -334,6 +285,7 @@ def add_folder_to_metadata(folder_path: str, folder_name: str, parent_path: str,
         'actual_path': folder_path,
         'type': 'custom',
         'parent_path': parent_path,
+        'parent_part': resolve_parent_part(parent_path, folder_metadata),
         'folder_name': folder_name,  # Full name with prefix
         'naming_base': folder_name   # Use full name for file naming
     }
@@ -347,41 +299,23 @@ def add_folder_to_metadata(folder_path: str, folder_name: str, parent_path: str,
         SessionManager.set('created_folders', current_folders)
 
 
+def resolve_parent_part(parent_path: str, folder_metadata: Dict) -> Optional[int]:
+    """Resolve the part number a new folder lives under, or None if it is outside any part"""
+    parent_id = SessionManager.get_folder_index()['id_by_path'].get(parent_path)
+    if parent_id in folder_metadata:
+        return folder_metadata[parent_id].get('parent_part')
+    
+    # Part folders are not tracked in metadata; they are named <base>_Part_<n>
+    _, sep, part_suffix = Path(parent_path).name.rpartition("_Part_")
+    if sep and part_suffix.isdigit():
+        return int(part_suffix)
+    return None
+
+
 def get_project_path(base_name: str) -> Path:
     """Get the project path using project destination"""
-    # Use project destination instead of current directory  
-    project_destination = SessionManager.get_project_destination()
-    if project_destination and os.path.exists(project_destination):
-        base_path = Path(project_destination)
-    else:
-        base_path = Path.cwd()
-    
-    project_path = base_path / base_name
-    
-    if not project_path.exists():
-        # Create if doesn't exist
-        project_path.mkdir(parents=True, exist_ok=True)
-    
-    return project_path
-
+    return SessionManager.get_project_path(base_name)
 
-def get_all_project_folders(project_path: Path) -> List[tuple]:
-    """Get all folders within the project directory"""
-    
-    folders = []
-    
-    try:
-        for item in project_path.rglob('*'):
-            if item.is_dir() and item != project_path:
-                relative_path = item.relative_to(project_path)
-                depth = len(relative_path.parts) - 1
-                folders.append((str(item.absolute()), str(relative_path), depth))
-        
-        folders.sort(key=lambda x: (x[2], x[1]))
-        return folders
-    
-    except Exception:
-        return []
 
 def render_custom_folders_summary():
     """Render summary of created custom folders"""
@@ -390,10 +324,10 @@ def render_custom_folders_summary():
     
     folder_metadata = SessionManager.get('folder_metadata', {})
     
-    # Filter custom folders
+    # Custom folders come from the index maintained on metadata writes
     custom_folders = [
-        (folder_id, metadata) for folder_id, metadata in folder_metadata.items()
-        if metadata.get('type') == 'custom'
+        (folder_id, folder_metadata[folder_id])
+        for folder_id in SessionManager.get_folder_index()['custom_folders']
     ]
     
     if not custom_folders:
@@ -123,9 +123,8 @@ def render_default_folder_selection(config: dict):
     # Show preview of selected folders
     if selected_folders:
         st.markdown("**Selected folders to create:**")
-        safe_code = FolderManager.sanitize_name(config['code'])
         book_name = config['book_name']
-        base_name = f"{safe_code}_{book_name}"
+        safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
         
         # Apply font formatting to preview
         from core.text_formatter import TextFormatter
@@ -168,8 +167,7 @@ def create_folder_structure_with_selection(config: dict, selected_folders: List[
         if project_path:
             # Create custom parts folders if specified
             if custom_parts:
-                safe_code = FolderManager.sanitize_name(code)
-                base_name = f"{safe_code}_{book_name}"
+                safe_code, base_name = FolderManager.get_base_name(code, book_name)
                 custom_parts_folders = FolderManager.create_custom_parts_folders(
                     project_path, base_name, custom_parts
                 )
@@ -224,8 +222,7 @@ def create_folder_structure(config: dict):
         if project_path:
             # Create custom parts folders if specified
             if custom_parts:
-                safe_code = FolderManager.sanitize_name(code)
-                base_name = f"{safe_code}_{book_name}"
+                safe_code, base_name = FolderManager.get_base_name(code, book_name)
                 custom_parts_folders = FolderManager.create_custom_parts_folders(
                     project_path, base_name, custom_parts
                 )
@@ -319,9 +316,8 @@ def calculate_total_pages_generated(config: Dict) -> int:
     """Calculate total number of PDF pages generated in all folders"""
     from pathlib import Path
     
-    safe_code = FolderManager.sanitize_name(config.get('code', ''))
     book_name = config.get('book_name', '')
-    base_name = f"{safe_code}_{book_name}"
+    safe_code, base_name = FolderManager.get_base_name(config.get('code', ''), book_name)
     
     # Get project path
     project_destination = SessionManager.get_project_destination()
@@ -337,7 +333,18 @@ def calculate_total_pages_generated(config: Dict) -> int:
     
     # Count all PDF files recursively
     try:
-        pdf_files = list(project_path.rglob("*.pdf"))
-        return len(pdf_files)
+        return _count_pdf_files_recursive(str(project_path))
     except Exception:
-        return 0
\ No newline at end of file
+        return 0
+
+
+def _count_pdf_files_recursive(dir_path: str) -> int:
+    """Count PDF files under a folder with scandir, without building Path objects or a file list"""
+    total = 0
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _count_pdf_files_recursive(entry.path)
+            elif entry.name.endswith('.pdf'):
+                total += 1
+    return total
\ No newline at end of file
@@ -1,10 +1,42 @@
 import streamlit as st
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional
 from core.session_manager import SessionManager
-from core.pdf_handler import PDFExtractor
-from core.folder_manager import FolderManager, ChapterManager
+from core.pdf_handler import PDFHandler, PDFExtractor
+from core.folder_manager import FolderManager
 from pathlib import Path
 import os
+import stat
+import time
+from itertools import islice
+
+
+@dataclass(frozen=True, slots=True)
+class Destination:
+    """Extraction destination folder and the base name used for its page files"""
+    path: str
+    naming_base: str
+    
+    @property
+    def is_selected(self) -> bool:
+        return bool(self.path)
+
+
+NO_DESTINATION = Destination("", "")
+
+# Seconds before the cached project folder walk is refreshed from disk
+FOLDER_WALK_TTL = 60
+
+# Maximum number of folders offered in the destination dropdown at once
+FOLDER_OPTIONS_LIMIT = 50
+
+
+class FolderCatalog(NamedTuple):
+    """Folder ids bucketed by type, read from the session folder index"""
+    chapters: Dict[int, List[str]]  # part number -> chapter folder ids
+    custom_by_part: Dict[int, List[str]]  # part number -> custom folder ids
+    custom: List[str]
+    has_any: bool
 
 
 def render_page_assignment_page():
@@ -22,8 +54,8 @@ def render_page_assignment_page():
         del st.session_state['selected_page_destination_name']
         
         # Proceed with this destination
-        destination_info = (selected_path, selected_name)
-        render_page_range_input(destination_info)
+        destination_info = Destination(selected_path, selected_name)
+        render_page_range_input(destination_info, SessionManager.get('total_pages', 0))
         return
     
     # Check prerequisites
@@ -82,12 +114,12 @@ def render_assignment_interface():
         destination_info = render_manual_path_input()
     
     # Only show page range input if we have a valid destination
-    if destination_info and destination_info[0]:
-        render_page_range_input(destination_info)
+    if destination_info and destination_info.is_selected:
+        render_page_range_input(destination_info, SessionManager.get('total_pages', 0))
     else:
         st.info("Please select a destination folder first")
 
-def render_manual_path_input() -> Tuple[str, str]:
+def render_manual_path_input() -> Destination:
     """Render simple manual path input"""
     
     st.markdown("**Enter destination path:**")
@@ -99,79 +131,91 @@ def render_manual_path_input() -> Tuple[str, str]:
         help="Enter the complete path to destination folder"
     )
     
-    if manual_path.strip():
-        path = Path(manual_path.strip())
+    manual_path = manual_path.strip()
+    if manual_path:
+        path = Path(manual_path)
+        path_name = path.name
         
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            # Show path validation status
-            if path.exists() and path.is_dir():
-                st.success(f"✅ Valid folder: {path.name}")
-            elif not path.exists():
-                st.info(f"📁 Will be created: {path.name}")
+            # Show path validation status (one stat per keystroke rerun)
+            try:
+                path_mode = os.stat(path).st_mode
+            except OSError:
+                path_mode = None
+            
+            if path_mode is None:
+                st.info(f"📁 Will be created: {path_name}")
+            elif stat.S_ISDIR(path_mode):
+                st.success(f"✅ Valid folder: {path_name}")
             else:
                 st.error("❌ Invalid path")
         
         with col2:
             if st.button("Use Path", key="use_manual_path", type="primary", use_container_width=True):
-                return (str(path.absolute()), path.name)
+                return Destination(str(path.absolute()), path_name)
     
-    return ("", "")
+    return NO_DESTINATION
 
-def render_project_folder_selection() -> Tuple[str, str]:
+def render_project_folder_selection() -> Destination:
     """Render project folder selection with browse interface"""
     
     config = SessionManager.get('project_config', {})
     if not config.get('code') or not config.get('book_name'):
         st.error("Project configuration missing.")
-        return ("", "")
+        return NO_DESTINATION
     
-    safe_code = FolderManager.sanitize_name(config['code'])
     book_name = config['book_name']
-    base_name = f"{safe_code}_{book_name}"
+    safe_code, base_name = FolderManager.get_base_name(config['code'], book_name)
     
     # Get project path
     project_path = get_project_path(base_name)
     
     if not project_path.exists():
         st.error("Project folder not found. Please create folder structure first.")
-        return ("", "")
+        return NO_DESTINATION
     
-    # Get all folders in the project including metadata
+    # Get all subfolders in the project including metadata
     available_folders = get_project_folders_with_metadata(project_path)
     
     if not available_folders:
-        st.info("No folders found in the project.")
-        return ("", "")
+        st.info("No subfolders found in the project. Pages can still be extracted into the project root.")
     
     # Create folder browser interface with better styling
     st.markdown("**Select destination from project folders:**")
     
-    folder_options = []
-    folder_info_list = []
-    
-    # Add project root as an option
-    folder_options.append(f"📂 {project_path.name} (Project Root)")
-    folder_info_list.append((str(project_path.absolute()), {"naming_base": project_path.name}))
-    
-    # Add all subfolders with proper hierarchy display
-    for folder_info in available_folders:
-        display_name, folder_path, folder_type, metadata = folder_info
-        folder_options.append(display_name)
-        folder_info_list.append((folder_path, metadata))
-    
-    # Use selectbox with better label
-    selected_index = st.selectbox(
+    # Large projects: narrow the dropdown with a filter rather than sending every folder to the browser
+    if len(available_folders) > FOLDER_OPTIONS_LIMIT:
+        filter_text = st.text_input(
+            "Filter folders",
+            key="page_dest_folder_filter",
+            placeholder="Type part of a folder name"
+        ).strip().lower()
+        if filter_text:
+            available_folders = [info for info in available_folders if filter_text in info[0].lower()]
+        if len(available_folders) > FOLDER_OPTIONS_LIMIT:
+            st.caption(f"Showing {FOLDER_OPTIONS_LIMIT} of {len(available_folders)} folders - refine the filter to see more")
+            available_folders = available_folders[:FOLDER_OPTIONS_LIMIT]
+    
+    # Project root first, then all subfolders with proper hierarchy display
+    root_path = str(project_path.absolute())
+    folder_choices = {root_path: (f"📂 {project_path.name} (Project Root)", {"naming_base": project_path.name})}
+    for display_name, folder_path, folder_type, metadata in available_folders:
+        folder_choices[folder_path] = (display_name, metadata)
+    
+    # Options are folder paths and the key depends only on the project, so the widget (and the
+    # current selection) survives folders being added or filtered
+    selected_folder_path = st.selectbox(
         "Choose destination folder:",
-        range(len(folder_options)),
-        format_func=lambda x: folder_options[x],
+        list(folder_choices),
+        format_func=lambda path: folder_choices[path][0],
         help="Select the folder where you want to extract pages",
-        key=f"page_dest_folder_{len(folder_options)}_{hash(str(folder_options)) % 10000}"
+        key=f"page_dest_folder_{root_path}"
     )
     
-    if selected_index is not None:
-        selected_folder_path, selected_metadata = folder_info_list[selected_index]
+    if selected_folder_path is not None:
+        selected_folder_display, selected_metadata = folder_choices[selected_folder_path]
         folder_name = selected_metadata.get('naming_base') if selected_metadata else Path(selected_folder_path).name
         
         # Show selected folder info
@@ -179,29 +223,23 @@ def render_project_folder_selection() -> Tuple[str, str]:
         st.caption(f"Path: `{selected_folder_path}`")
         
         # Check if selected folder is a Part folder and show additional options
-        selected_folder_display = folder_options[selected_index]
-        if "📂" in selected_folder_display and "_Part_" in selected_folder_path:
-            return render_part_folder_options(selected_folder_path, folder_name, selected_folder_display)
+        if selected_metadata and selected_metadata.get('type') == 'part':
+            return render_part_folder_options(
+                selected_folder_path, folder_name, selected_folder_display, selected_metadata['part_number']
+            )
         
-        return (selected_folder_path, folder_name)
+        return Destination(selected_folder_path, folder_name)
     
-    return ("", "")
+    return NO_DESTINATION
 
-def render_part_folder_options(part_folder_path: str, part_folder_name: str, part_display_name: str) -> Tuple[str, str]:
+def render_part_folder_options(part_folder_path: str, part_folder_name: str, part_display_name: str,
+                               part_number: int) -> Destination:
     """Render options when a Part folder is selected"""
     
     st.markdown("---")
     st.markdown("**📖 Part Folder Selected - Choose Destination:**")
     st.info(f"Selected: {part_display_name}")
     
-    # Extract part number from folder path
-    part_number = None
-    try:
-        if "_Part_" in part_folder_path:
-            part_number = int(Path(part_folder_path).name.split("_Part_")[-1])
-    except (ValueError, IndexError):
-        pass
-    
     # Option selection
     part_destination_option = st.radio(
         "Where do you want to extract pages?",
@@ -212,221 +250,213 @@ def render_part_folder_options(part_folder_path: str, part_folder_name: str, par
     
     if part_destination_option == "📂 Directly into the Part folder":
         # Return the part folder itself
-        return (part_folder_path, part_folder_name)
+        return Destination(part_folder_path, part_folder_name)
     
     else:  # Into a specific chapter
-        if part_number is None:
-            st.error("Could not determine part number from folder path.")
-            return ("", "")
-        
-        # Get chapters for this part
+        # Get chapters and custom folders for this part
         chapters_info = get_chapters_for_part(part_number)
+        part_custom_folders = get_custom_folders_for_part(part_number)
         
-        if not chapters_info:
+        if not chapters_info and not part_custom_folders:
             st.warning(f"No chapters found in Part {part_number}. Create chapters first or choose direct insertion.")
-            return ("", "")
+            return NO_DESTINATION
         
-        # Chapter selection dropdown
-        chapter_options = [f"📖 {info['display_name']}" for info in chapters_info]
+        # Chapter selection dropdown, followed by custom folders created inside this part;
+        # options are folder paths so the selection survives chapters being added
+        chapter_choices = {info['folder_path']: (f"📖 {info['display_name']}", info) for info in chapters_info}
+        chapter_choices.update(
+            (info['folder_path'], (f"📁 {info['display_name']}", info)) for info in part_custom_folders
+        )
         
-        selected_chapter_index = st.selectbox(
+        selected_chapter_path = st.selectbox(
             f"Select chapter in Part {part_number}:",
-            range(len(chapter_options)),
-            format_func=lambda x: chapter_options[x],
+            list(chapter_choices),
+            format_func=lambda path: chapter_choices[path][0],
             help="Choose which chapter to extract pages into",
-            key=f"chapter_select_part_{part_number}_{len(chapters_info)}"
+            key=f"chapter_select_part_{part_number}"
         )
         
-        if selected_chapter_index is not None:
-            selected_chapter_info = chapters_info[selected_chapter_index]
-            return (selected_chapter_info['folder_path'], selected_chapter_info['naming_base'])
+        if selected_chapter_path is not None:
+            selected_chapter_info = chapter_choices[selected_chapter_path][1]
+            return Destination(selected_chapter_info['folder_path'], selected_chapter_info['naming_base'])
     
-    return ("", "")
+    return NO_DESTINATION
 
 def get_chapters_for_part(part_number: int) -> List[Dict]:
-    """Get all chapters for a specific part from metadata"""
+    """Get all chapters for a specific part, cached until folder_metadata is next written"""
+    version = SessionManager.get('folder_metadata_version', 0)
+    cached = st.session_state.get('part_chapters_cache')
+    if not cached or cached[0] != version:
+        cached = (version, {})
+        st.session_state['part_chapters_cache'] = cached
+    
+    chapters_by_part = cached[1]
+    if part_number not in chapters_by_part:
+        chapters_by_part[part_number] = _build_chapters_for_part(part_number)
+    return chapters_by_part[part_number]
+
+def _build_chapters_for_part(part_number: int) -> List[Dict]:
+    """Build the chapter list for a part from metadata"""
+    catalog = get_available_folders()
+    if not catalog.has_any:
+        return []
     
     folder_metadata = SessionManager.get('folder_metadata', {})
+    part_prefix = f"_Part_{part_number}_Chapter_"
     chapters_info = []
     
-    for folder_id, metadata in folder_metadata.items():
-        if (metadata.get('type') == 'chapter' and 
-            metadata.get('parent_part') == part_number):
-            
-            # Create display name from folder name
-            folder_name = metadata.get('folder_name', '')
-            chapter_display = folder_name.replace(f"_Part_{part_number}_Chapter_", "Chapter ")
-            
-            chapters_info.append({
-                'folder_id': folder_id,
-                'display_name': chapter_display,
-                'folder_path': metadata.get('actual_path'),
-                'naming_base': metadata.get('naming_base'),
-                'chapter_number': metadata.get('chapter_number', ''),
-                'chapter_name': metadata.get('chapter_name', '')
-            })
-    
-    # Sort chapters by number if possible
-    def sort_key(chapter):
-        try:
-            # Try to extract number for sorting
-            chapter_num = chapter.get('chapter_number', '')
-            if chapter_num.isdigit():
-                return (0, int(chapter_num))  # Numeric chapters first
-            elif chapter_num.startswith('null_'):
-                return (1, int(chapter_num.split('_')[-1]))  # null chapters second
-            else:
-                return (2, chapter_num)  # Other chapters last
-        except (ValueError, AttributeError):
-            return (3, chapter.get('display_name', ''))
+    # The index keeps each part's chapters already sorted
+    for folder_id in catalog.chapters.get(part_number, []):
+        metadata = folder_metadata[folder_id]
+        
+        # Create display name from folder name
+        chapters_info.append({
+            'folder_id': folder_id,
+            'display_name': metadata.get('folder_name', '').replace(part_prefix, "Chapter "),
+            'folder_path': metadata.get('actual_path'),
+            'naming_base': metadata.get('naming_base'),
+            'chapter_number': metadata.get('chapter_number', ''),
+            'chapter_name': metadata.get('chapter_name', '')
+        })
     
-    chapters_info.sort(key=sort_key)
     return chapters_info
 
-# def render_system_folder_browser() -> Tuple[str, str]:
-#     """Render system-wide folder browser for page extraction"""
-    
-#     st.markdown("**Browse or enter destination:**")
-    
-#     # Create tabs for better organization
-#     tab1, tab2, tab3 = st.tabs(["🔍 Browse", "⚡ Quick Access", "⌨️ Manual Path"])
-    
-#     with tab1:
-#         # Browse button
-#         if st.button("📂 Open Folder Browser", key="open_browser_btn", type="primary", use_container_width=True):
-#             st.session_state['show_folder_browser'] = True
-#             st.session_state['folder_browser_active'] = True
-#             st.session_state['folder_browser_context'] = 'page_assignment'
-#             st.rerun()
-        
-#         st.caption("Opens a visual folder browser to navigate and select destination")
-    
-#     with tab2:
-#         # Quick selection options
-#         from src.ui.folder_selector import get_quick_access_folders
-#         quick_folders = get_quick_access_folders()
-        
-#         if quick_folders:
-#             for name, path in quick_folders.items():
-#                 if st.button(f"📁 {name}", key=f"select_{name.replace(' ', '_')}", use_container_width=True):
-#                     return (path, Path(path).name)
-#                 st.caption(f"`{path}`")
-#         else:
-#             st.info("No quick access folders available")
-    
-#     with tab3:
-#         # Manual input
-#         manual_path = st.text_input(
-#             "Enter folder path:",
-#             placeholder="e.g., /Users/username/Documents/MyFolder",
-#             key="manual_path_input",
-#             help="Enter the complete path to destination folder"
-#         )
-        
-#         if manual_path.strip():
-#             path = Path(manual_path.strip())
-            
-#             # Show path validation status
-#             if path.exists() and path.is_dir():
-#                 st.success(f"✅ Valid folder: {path.name}")
-#             elif not path.exists():
-#                 st.info(f"📁 Will be created: {path.name}")
-#             else:
-#                 st.error("❌ Invalid path")
-            
-#             if st.button("Use This Path", key="use_manual_path", type="primary", use_container_width=True):
-#                 return (str(path.absolute()), path.name)
+def get_custom_folders_for_part(part_number: int) -> List[Dict]:
+    """Get custom folders created anywhere inside a specific part from metadata"""
+    folder_metadata = SessionManager.get('folder_metadata', {})
     
-#     return ("", "")
+    return [
+        {
+            'folder_id': folder_id,
+            'display_name': folder_metadata[folder_id].get('display_name', ''),
+            'folder_path': folder_metadata[folder_id].get('actual_path'),
+            'naming_base': folder_metadata[folder_id].get('naming_base')
+        }
+        for folder_id in get_available_folders().custom_by_part.get(part_number, [])
+    ]
+
+def get_available_folders() -> FolderCatalog:
+    """Get folder ids bucketed by type from the index maintained by SessionManager"""
+    index = SessionManager.get_folder_index()
+    chapters = index['chapters_by_part']
+    custom = index['custom_folders']
+    return FolderCatalog(
+        chapters=chapters,
+        custom_by_part=index.get('custom_by_part', {}),
+        custom=custom,
+        has_any=bool(chapters or custom)
+    )
 
 
 def get_project_path(base_name: str) -> Path:
     """Get the project path using project destination"""
-    # Use project destination instead of current directory
-    project_destination = SessionManager.get_project_destination()
-    if project_destination and os.path.exists(project_destination):
-        base_path = Path(project_destination)
-    else:
-        base_path = Path.cwd()
-    
-    project_path = base_path / base_name
-    
-    if not project_path.exists():
-        # Create if doesn't exist
-        project_path.mkdir(parents=True, exist_ok=True)
-    
-    return project_path
+    return SessionManager.get_project_path(base_name)
 
 def get_project_folders_with_metadata(project_path: Path) -> List[tuple]:
     """
-    Get all folders within the project directory with metadata
+    Get all subfolders within the project directory with metadata (the project root is not included)
     Returns list of (display_name, folder_path, folder_type, metadata) tuples
+    
+    The walk is cached in session state until folder_metadata is written, the project root
+    changes, or FOLDER_WALK_TTL seconds pass (which picks up changes made outside the app).
     """
+    project_path_str = os.path.abspath(project_path)
+    try:
+        root_mtime = os.stat(project_path_str).st_mtime_ns
+    except OSError:
+        return []
+    
+    cache_key = (project_path_str, SessionManager.get('folder_metadata_version', 0), root_mtime)
+    cached = st.session_state.get('project_folders_cache')
+    if cached and cached[0] == cache_key and time.monotonic() - cached[1] < FOLDER_WALK_TTL:
+        return cached[2]
+    
+    folders = _scan_project_folders(project_path_str)
+    if folders is None:
+        # A failed walk isn't cached, so the next run retries it
+        return []
+    st.session_state['project_folders_cache'] = (cache_key, time.monotonic(), folders)
+    return folders
+
+def _scan_project_folders(project_path: str) -> Optional[List[tuple]]:
+    """Walk the project tree and attach metadata to each subfolder (None if the walk failed)"""
     
     folders = []
     folder_metadata = SessionManager.get('folder_metadata', {})
+    id_by_path = SessionManager.get_folder_index()['id_by_path']
     
     try:
-        # Add project root
-        folders.append((
-            f"📂 {project_path.name} (Project Root)",
-            str(project_path.absolute()),
-            "root",
-            {"naming_base": project_path.name}
-        ))
-        
-        # Get all subfolders
-        for item in project_path.rglob('*'):
-            if item.is_dir() and item != project_path:
-                relative_path = item.relative_to(project_path)
-                depth = len(relative_path.parts) - 1
-                
-                # Check if this folder has metadata
-                folder_metadata_info = None
-                for folder_id, metadata in folder_metadata.items():
-                    if metadata.get('actual_path') == str(item.absolute()):
-                        folder_metadata_info = metadata
-                        break
-                
-                # Generate display name with proper indentation and icons
-                indent = "  " * depth
-                folder_icon = "📁" if depth == 0 else "└─"
-                folder_name = item.name
-                
-                # Enhanced display for special folder types
-                if folder_metadata_info:
-                    folder_type = folder_metadata_info.get('type', 'unknown')
-                    if folder_type == 'chapter':
-                        folder_icon = "📖"
-                    elif folder_type == 'custom':
-                        folder_icon = "🗂️"
-                    display_name = f"{indent}{folder_icon} {folder_name}"
-                else:
-                    # Regular folder
-                    if "Part_" in folder_name:
-                        folder_icon = "📂"
-                    display_name = f"{indent}{folder_icon} {folder_name}"
-                
-                folders.append((
-                    display_name,
-                    str(item.absolute()),
-                    folder_metadata_info.get('type', 'regular') if folder_metadata_info else 'regular',
-                    folder_metadata_info
-                ))
-        
+        # Get all subfolders (depth-first, so each folder is followed by its children)
+        for folder_path, folder_name, depth in _walk_subfolders(project_path):
+            # Check if this folder has metadata
+            folder_id = id_by_path.get(folder_path)
+            folder_metadata_info = folder_metadata.get(folder_id) if folder_id else None
+            
+            # Generate display name with proper indentation and icons
+            indent = "  " * depth
+            folder_icon = "📁" if depth == 0 else "└─"
+            
+            # Enhanced display for special folder types
+            if folder_metadata_info:
+                folder_type = folder_metadata_info.get('type', 'unknown')
+                if folder_type == 'chapter':
+                    folder_icon = "📖"
+                elif folder_type == 'custom':
+                    folder_icon = "🗂️"
+                display_name = f"{indent}{folder_icon} {folder_name}"
+            else:
+                # Regular folder; numbered Part folders (<base>_Part_<n>) are typed here once
+                # so selection can offer chapter destinations without re-parsing the path
+                _, part_sep, part_suffix = folder_name.rpartition("_Part_")
+                if part_sep and part_suffix.isdigit():
+                    folder_metadata_info = {'type': 'part', 'part_number': int(part_suffix), 'naming_base': folder_name}
+                if "Part_" in folder_name:
+                    folder_icon = "📂"
+                display_name = f"{indent}{folder_icon} {folder_name}"
+            
+            folders.append((
+                display_name,
+                folder_path,
+                folder_metadata_info.get('type', 'regular') if folder_metadata_info else 'regular',
+                folder_metadata_info
+            ))
+    
         return folders
     
     except Exception:
-        return []
+        return None
+
+def _walk_subfolders(root_path: str):
+    """Yield (absolute path, name, depth) for every subfolder, reusing scandir's cached entry type
+    
+    Walks depth-first with an explicit stack of open scandir iterators, so each folder is still
+    followed by its children without re-yielding through one generator frame per level.
+    """
+    stack = [(os.scandir(root_path), 0)]
+    try:
+        while stack:
+            entries, depth = stack[-1]
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield entry.path, entry.name, depth
+                    stack.append((os.scandir(entry.path), depth + 1))
+                    break
+            else:
+                stack.pop()[0].close()
+    finally:
+        for entries, _ in stack:
+            entries.close()
 
 
-def render_page_range_input(destination_info: Tuple[str, str]):
-    """Render page range input and extraction controls"""
+@st.fragment
+def render_page_range_input(destination_info: Destination, total_pages: int):
+    """Render page range input and extraction controls (reruns scoped to this fragment)"""
     
-    destination_path, naming_base = destination_info
+    destination_path, naming_base = destination_info.path, destination_info.naming_base
+    destination_name = Path(destination_path).name
     
     st.markdown("### Page Range Assignment")
-    st.markdown(f"**Selected Destination:** `{Path(destination_path).name}`")
+    st.markdown(f"**Selected Destination:** `{destination_name}`")
     st.caption(f"Full path: {destination_path}")
     
     # Verify the destination exists and show status
@@ -435,47 +465,47 @@ def render_page_range_input(destination_info: Tuple[str, str]):
     else:
         st.info("Destination folder will be created during extraction")
     
-    total_pages = SessionManager.get('total_pages', 0)
-    
     # Get initial value (empty if extraction was just completed)
     initial_ranges = "" if st.session_state.get('extraction_just_completed') else ""
     
-    # Page range input with examples and unique key
+    # Page range input and buttons share a form, so editing the ranges doesn't rerun anything
+    # until the form is submitted (Enter or either button)
     st.markdown("**Enter page ranges:**")
-    ranges_input_key = f"page_ranges_{hash(destination_path) % 10000}"
-    page_ranges_text = st.text_input(
-        "Page Ranges",
-        value=initial_ranges,
-        placeholder="Examples: 1, 5, 10 or 1-5, 10-15 or 1-3, 7, 12-20",
-        help=f"Specify pages to extract (1-{total_pages}). Buttons are enabled as soon as you start typing.",
-        key=ranges_input_key
-    )
-    
-    # Show buttons
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        preview_disabled = not page_ranges_text.strip()
-        preview_key = f"preview_btn_{hash(destination_path + str(preview_disabled)) % 10000}"
-        if st.button("Preview Assignment", type="secondary", disabled=preview_disabled, key=preview_key):
-            if page_ranges_text.strip():
-                page_ranges = [r.strip() for r in page_ranges_text.split(',') if r.strip()]
-                render_assignment_preview(Path(destination_path).name, page_ranges, total_pages, naming_base)
-    
-    with col2:
-        extract_disabled = not page_ranges_text.strip()
-        extract_key = f"extract_btn_{hash(destination_path + str(extract_disabled)) % 10000}"
-        if st.button("Extract Pages", type="primary", disabled=extract_disabled, key=extract_key):
-            if page_ranges_text.strip():
-                page_ranges = [r.strip() for r in page_ranges_text.split(',') if r.strip()]
-                # Debug: Confirm destination before extraction
-                st.info(f"Starting extraction to: {destination_path}")
-                execute_page_extraction(destination_info, page_ranges, total_pages)
+    with st.form(f"page_range_form_{destination_path}", border=False):
+        page_ranges_text = st.text_input(
+            "Page Ranges",
+            value=initial_ranges,
+            placeholder="Examples: 1, 5, 10 or 1-5, 10-15 or 1-3, 7, 12-20",
+            help=f"Specify pages to extract (1-{total_pages}). Press Enter to check the ranges before extracting.",
+            key=f"page_ranges_{destination_path}"
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            preview_clicked = st.form_submit_button(
+                "Preview Assignment", type="secondary", key=f"preview_btn_{destination_path}"
+            )
+        with col2:
+            extract_clicked = st.form_submit_button(
+                "Extract Pages", type="primary", key=f"extract_btn_{destination_path}"
+            )
+    
+    # Parse once per fragment run; reused by both buttons and the live preview
+    page_ranges = tuple(r.strip() for r in page_ranges_text.split(',') if r.strip())
+    has_input = bool(page_ranges)
+    
+    if (preview_clicked or extract_clicked) and not has_input:
+        st.warning("Enter at least one page or page range first.")
+    elif preview_clicked:
+        render_assignment_preview(destination_name, page_ranges, total_pages, naming_base)
+    elif extract_clicked:
+        # Debug: Confirm destination before extraction
+        st.info(f"Starting extraction to: {destination_path}")
+        execute_page_extraction(destination_info, page_ranges, total_pages)
     
     # Show preview of page ranges if text is entered
-    if page_ranges_text.strip():
-        page_ranges = [r.strip() for r in page_ranges_text.split(',') if r.strip()]
-        preview = PDFExtractor.preview_page_extraction(page_ranges, total_pages)
+    if has_input:
+        preview = _cached_preview(page_ranges, total_pages)
         
         if "No valid pages" in preview:
             st.error(preview)
@@ -483,10 +513,22 @@ def render_page_range_input(destination_info: Tuple[str, str]):
             st.info(preview)
 
 
-def render_assignment_preview(display_name: str, page_ranges: List[str], total_pages: int, naming_base: str):
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_preview(page_ranges: tuple, total_pages: int) -> str:
+    """Cached extraction preview, keyed on the parsed range tuple"""
+    return PDFExtractor.preview_page_extraction(list(page_ranges), total_pages)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_pages(page_ranges: tuple, total_pages: int) -> List[int]:
+    """Cached page list for the parsed range tuple (warnings for invalid ranges are replayed on hits)"""
+    return PDFExtractor.parse_page_ranges(list(page_ranges), total_pages)
+
+
+def render_assignment_preview(display_name: str, page_ranges: tuple, total_pages: int, naming_base: str):
     """Render preview of page assignment"""
     
-    pages = PDFExtractor.parse_page_ranges(page_ranges, total_pages)
+    pages = _cached_pages(page_ranges, total_pages)
     
     if pages:
         st.success(f"Ready to extract {len(pages)} pages to: `{display_name}`")
@@ -495,14 +537,14 @@ def render_assignment_preview(display_name: str, page_ranges: List[str], total_p
             st.markdown("**Files that will be created:**")
             safe_folder_name = PDFExtractor.sanitize_filename(naming_base)
             
-            # Show first 10 files as preview
+            # Show first 10 files as preview, sequentially numbered from 1
             preview_count = min(10, len(pages))
-            for i in range(1, preview_count + 1):  # Sequential numbering from 1
-                file_name = f"{safe_folder_name}_Page_{i}.pdf"
-                st.write(f"📄 {file_name}")
-            
+            preview_lines = [f"📄 {safe_folder_name}_Page_{i}.pdf" for i in range(1, preview_count + 1)]
             if len(pages) > preview_count:
-                st.write(f"... and {len(pages) - preview_count} more files")
+                preview_lines.append(f"... and {len(pages) - preview_count} more files")
+            
+            # One markdown element instead of one delta per file
+            st.markdown("  \n".join(preview_lines))
                 
             st.markdown(f"**Destination:** `{display_name}`")
     else:
@@ -510,18 +552,18 @@ def render_assignment_preview(display_name: str, page_ranges: List[str], total_p
         
 
 
-def execute_page_extraction(destination_info: Tuple[str, str], page_ranges: List[str], total_pages: int):
+def execute_page_extraction(destination_info: Destination, page_ranges: List[str], total_pages: int):
     """Execute the page extraction process"""
     
-    destination_path, naming_base = destination_info
+    destination_path, naming_base = destination_info.path, destination_info.naming_base
     folder_path = Path(destination_path)
+    folder_name = folder_path.name
     
     try:
         # Check if destination folder already has PDF files
-        if folder_path.exists():
-            existing_pdfs = list(folder_path.glob("*.pdf"))
-            if existing_pdfs:
-                st.warning(f"Destination folder already contains {len(existing_pdfs)} PDF files. New files will be added alongside existing ones.")
+        existing_pdfs = count_pdf_files(destination_path)
+        if existing_pdfs:
+            st.warning(f"Destination folder already contains {existing_pdfs} PDF files. New files will be added alongside existing ones.")
         
         # Ensure the folder exists
         folder_path.mkdir(parents=True, exist_ok=True)
@@ -531,29 +573,42 @@ def execute_page_extraction(destination_info: Tuple[str, str], page_ranges: List
         status_text = st.empty()
         
         # Execute extraction
-        status_text.text(f"Extracting pages to {folder_path.name}...")
-        progress_bar.progress(20)
+        status_text.text(f"Extracting pages to {folder_name}...")
+        
+        # Throttle progress updates to at most 20/s so large extractions don't flood the websocket
+        last_update = [0.0]
+        
+        def report_progress(done: int, total: int):
+            now = time.monotonic()
+            if now - last_update[0] > 0.05:
+                progress_bar.progress(done / total)
+                last_update[0] = now
+        
+        # Pass the exact path without any modification; the reader is parsed once per upload
+        pdf_reader = PDFHandler.get_pdf_reader()
+        if not pdf_reader:
+            # get_pdf_reader has already reported the problem
+            progress_bar.empty()
+            status_text.empty()
+            return
         
-        # Pass the exact path without any modification
         success, created_files, error_msg = PDFExtractor.extract_pages_to_folder(
-            page_ranges, destination_path, naming_base, total_pages
+            page_ranges, destination_path, naming_base, total_pages, pdf_reader, report_progress
         )
         
-        progress_bar.progress(100)
+        progress_bar.progress(1.0)
         
         if success and created_files:
-            # Update extraction history
-            extraction_history = SessionManager.get('extraction_history', [])
-            extraction_record = {
-                'destination': folder_path.name,
+            # Update extraction history (only a sample of file paths is kept per record)
+            SessionManager.record_extraction({
+                'destination': folder_name,
                 'destination_path': destination_path,
                 'pages_extracted': len(created_files),
-                'page_ranges': page_ranges,
-                'files_created': created_files,
+                'page_ranges': list(page_ranges),
+                'files_created': [file_path for file_path, _ in created_files[:10]],
+                'file_names': [file_name for _, file_name in created_files[:10]],
                 'naming_base': naming_base
-            }
-            extraction_history.append(extraction_record)
-            SessionManager.set('extraction_history', extraction_history)
+            })
             
             # Store extraction info for success message
             st.session_state['last_extraction_info'] = {
@@ -566,8 +621,8 @@ def execute_page_extraction(destination_info: Tuple[str, str], page_ranges: List
             progress_bar.empty()
             status_text.empty()
             
-            # Force page refresh to show success message and clear inputs
-            st.rerun()
+            # Force full app refresh (not just the fragment) to show success message and clear inputs
+            st.rerun(scope="app")
             
         elif success and not created_files:
             progress_bar.empty()
@@ -582,6 +637,15 @@ def execute_page_extraction(destination_info: Tuple[str, str], page_ranges: List
         st.error(f"Extraction error: {str(e)}")
 
 
+def count_pdf_files(folder_path: str) -> int:
+    """Count PDF files directly inside a folder (0 if it does not exist) without stat-ing each entry"""
+    try:
+        with os.scandir(folder_path) as entries:
+            return sum(1 for entry in entries if entry.name.endswith('.pdf') and entry.is_file())
+    except OSError:
+        return 0
+
+
 def render_assignment_summary():
     """Render summary of page assignments and extractions"""
     
@@ -593,32 +657,34 @@ def render_assignment_summary():
         st.info("No extractions completed yet")
         return
     
-    # Statistics
-    total_extractions = len(extraction_history)
-    total_pages_extracted = sum(record['pages_extracted'] for record in extraction_history)
-    
-    st.metric("Total Extractions", total_extractions)
-    st.metric("Pages Extracted", total_pages_extracted)
+    # Statistics (running totals maintained by SessionManager.record_extraction)
+    st.metric("Total Extractions", SessionManager.get('extraction_count', len(extraction_history)))
+    st.metric("Pages Extracted", SessionManager.get('extraction_total_pages', 0))
     
     # Recent extractions
     st.markdown("**Recent Extractions:**")
-    recent_extractions = list(reversed(extraction_history[-5:]))  # Show last 5
+    recent_extractions = islice(reversed(extraction_history), 5)  # Show last 5
     
     for i, record in enumerate(recent_extractions):
-        with st.expander(f"📂 {record['destination']} ({record['pages_extracted']} pages)", 
+        pages_extracted = record['pages_extracted']
+        with st.expander(f"📂 {record['destination']} ({pages_extracted} pages)", 
                         expanded=i == 0):
-            st.write(f"**Page Ranges:** {', '.join(record['page_ranges'])}")
-            st.write(f"**Files Created:** {len(record['files_created'])}")
-            st.write(f"**Location:** {record.get('destination_path', 'Unknown')}")
+            record_lines = [
+                f"**Page Ranges:** {', '.join(record['page_ranges'])}",
+                f"**Files Created:** {pages_extracted}",
+                f"**Location:** {record.get('destination_path', 'Unknown')}"
+            ]
+            
+            # Show sample files (records from older saved projects only have full paths)
+            sample_names = record.get('file_names') or [os.path.basename(p) for p in record['files_created'][:3]]
+            if sample_names:
+                record_lines.append("**Sample Files:**")
+                record_lines.extend(f"📄 {file_name}" for file_name in sample_names[:3])
+                if pages_extracted > 3:
+                    record_lines.append(f"... and {pages_extracted - 3} more")
             
-            # Show sample files
-            if record['files_created']:
-                st.write("**Sample Files:**")
-                sample_files = record['files_created'][:3]
-                for file_path in sample_files:
-                    st.write(f"📄 {os.path.basename(file_path)}")
-                if len(record['files_created']) > 3:
-                    st.write(f"... and {len(record['files_created']) - 3} more")
+            # One markdown element per record instead of one per line
+            st.markdown("  \n".join(record_lines))
     
     # Clear history option
     if st.button("🗑️ Clear History", help="Clear extraction history (files remain on disk)"):
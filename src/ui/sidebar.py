@@ -1,12 +1,16 @@
 # src/ui/sidebar.py - Modified to use lazy imports
 import streamlit as st
+import hashlib
 import json
 import os
+import re
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from core.session_manager import SessionManager
-from core.pdf_handler import PDFHandler
-from core.folder_manager import FolderManager
 from ui.font_selector import render_font_case_changer
 
 def render_sidebar():
@@ -29,201 +33,303 @@ def render_sidebar():
 
         render_destination_folder_selector()
 
+# Repeated Save clicks within this window are ignored
+SAVE_DEBOUNCE_SECONDS = 1.0
+
+# Saved project filenames are <code>_<book>_<YYYYMMDD_HHMMSS>; the book name may itself contain '_'
+PROJECT_STEM_PATTERN = re.compile(r'^(?P<info>.+)_(?P<timestamp>\d{8}_\d{6})$')
+
+# Small sidecar written next to each saved project so listing never has to open the project file
+PROJECT_META_SUFFIX = '.meta.json'
+
+# Session keys written to a saved project, with the value saved when a key is missing
+SAVED_PROJECT_DEFAULTS = {
+    'project_config': {},
+    'pdf_uploaded': False,
+    'total_pages': 0,
+    'folder_structure_created': False,
+    'created_folders': [],
+    'chapters_config': {},
+    'standalone_chapters': [],
+    'chapters_created': False,
+    'page_assignments': {},
+    'folder_metadata': {},
+    'unique_chapter_counter': 0,
+    'numbering_systems': {},
+    'chapter_suffixes': {},
+    'extraction_history': [],
+    'extraction_count': 0,
+    'extraction_total_pages': 0,
+    'custom_parts': {},
+    'project_destination_folder': '',
+    'project_destination_selected': False,
+    'total_pages_generated': 0,
+    'pages_calculated_timestamp': None,
+}
+
+# Saved projects listed per page in the sidebar
+PROJECTS_PAGE_SIZE = 10
+
+# Single writer thread, so saves reach the disk in the order they were made
+_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="project-save")
+
+# Saved-project listing, shared across sessions and rebuilt only when the projects folder changes
+_projects_cache = {'key': None, 'order': [], 'entries': {}}
+
 def get_projects_dir():
     """Get or create projects directory"""
     projects_dir = Path("saved_projects")
     projects_dir.mkdir(exist_ok=True)
     return projects_dir
 
-def get_existing_projects():
-    """Get list of existing project files with formatted display"""
-    projects_dir = get_projects_dir()
-    project_files = list(projects_dir.glob("*.json"))
+def get_existing_projects(limit: Optional[int] = None) -> Tuple[List[dict], int]:
+    """
+    Get the newest saved projects with formatted display (cached on the folder's mtime)
     
-    project_list = []
-    for f in project_files:
-        try:
-            # Parse the filename to extract info
-            parts = f.stem.split('_')
-            
-            # Find the timestamp part (starts with 4-digit year)
-            timestamp_start = None
-            for i, part in enumerate(parts):
-                if len(part) >= 4 and part[:4].isdigit():
-                    timestamp_start = i
-                    break
-            
-            if timestamp_start:
-                # Extract project info and timestamp
-                project_info = '_'.join(parts[:timestamp_start])
-                timestamp_str = '_'.join(parts[timestamp_start:])
-                
-                # Parse timestamp for display
-                try:
-                    timestamp = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                    display_name = f"{project_info} ({timestamp.strftime('%Y-%m-%d %H:%M:%S')})"
-                except ValueError:
-                    # Fallback if timestamp parsing fails
-                    display_name = f.stem
-            else:
-                # Old format or no timestamp
-                display_name = f.stem
-            
-            project_list.append({
-                'filename': f.stem,
-                'display_name': display_name,
-                'modified': f.stat().st_mtime
-            })
-            
-        except Exception:
-            # Fallback for any parsing issues
-            project_list.append({
-                'filename': f.stem,
-                'display_name': f.stem,
-                'modified': f.stat().st_mtime
-            })
-    
-    # Sort by modification time (newest first)
-    project_list.sort(key=lambda x: x['modified'], reverse=True)
+    Returns:
+        Tuple of (up to `limit` project dicts, newest first; total number of projects)
+    """
+    projects_dir = get_projects_dir()
+    try:
+        cache_key = (os.path.abspath(projects_dir), os.stat(projects_dir).st_mtime_ns)
+    except OSError:
+        return [], 0
+    if _projects_cache['key'] != cache_key:
+        _scan_projects_dir(projects_dir, cache_key)
+    
+    # Display entries are only built for the projects actually requested
+    order = _projects_cache['order']
+    file_entries = _projects_cache['entries']
+    projects = []
+    for _, name, meta_path in (order if limit is None else order[:limit]):
+        cached = file_entries.get(name)
+        if cached is None:
+            cached = (meta_path, build_project_entry(name[:-len('.json')], meta_path))
+            file_entries[name] = cached
+        projects.append(cached[1])
+    
+    return projects, len(order)
+
+def _scan_projects_dir(projects_dir: Path, cache_key: tuple):
+    """Re-list the projects folder, keeping display entries for files that haven't changed"""
+    with os.scandir(projects_dir) as entries:
+        json_entries = {
+            entry.name: entry for entry in entries
+            if not entry.name.startswith('.') and entry.name.endswith('.json') and entry.is_file()
+        }
     
-    return project_list
+    previous_entries = _projects_cache['entries']
+    order = []
+    file_entries = {}
+    for name in json_entries:
+        if name.endswith(PROJECT_META_SUFFIX):
+            continue
+        
+        stem = name[:-len('.json')]
+        meta_name = stem + PROJECT_META_SUFFIX
+        meta_path = json_entries[meta_name].path if meta_name in json_entries else None
+        # Saved files are named by their save time, so sorting on that needs no stat per file;
+        # names without a timestamp sort after the rest
+        match = PROJECT_STEM_PATTERN.match(stem)
+        order.append((match.group('timestamp') if match else '', name, meta_path))
+        
+        # Snapshots are never rewritten under the same name, so an entry only needs rebuilding
+        # when its metadata sidecar appears or disappears
+        cached = previous_entries.get(name)
+        if cached is not None and cached[0] == meta_path:
+            file_entries[name] = cached
+    
+    # Newest first
+    order.sort(reverse=True)
+    
+    _projects_cache['key'] = cache_key
+    _projects_cache['order'] = order
+    _projects_cache['entries'] = file_entries
+
+def build_project_entry(stem: str, meta_path: Optional[str]) -> dict:
+    """Build the listing entry for one saved project"""
+    # Projects saved before sidecars existed fall back to parsing the filename
+    display_name = (read_project_meta_display_name(meta_path) if meta_path else None) \
+        or format_project_display_name(stem)
+    return {
+        'filename': stem,
+        'display_name': display_name,
+        # Option text with long names truncated for the sidebar layout, built once per file
+        'row_label': f"📋 {display_name[:37]}..." if len(display_name) > 40 else f"📋 {display_name}"
+    }
+
+def read_project_meta_display_name(meta_path) -> Optional[str]:
+    """Build a project's display name from its metadata sidecar (None if it can't be read)"""
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        saved = datetime.fromisoformat(meta['saved_datetime'])
+        return f"{meta['code']}_{meta['book_name']} ({saved.strftime('%Y-%m-%d %H:%M:%S')})"
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def get_project_display_name(project_name):
+    """Display name for a saved project, from the cached listing when available"""
+    cached = _projects_cache['entries'].get(f"{project_name}.json")
+    if cached:
+        return cached[1]['display_name']
+    return format_project_display_name(project_name)
 
+def invalidate_projects_cache():
+    """Force the next get_existing_projects call to rescan the projects folder"""
+    _projects_cache['key'] = None
+
+@st.fragment
 def render_project_management_section():
-    """Render project management controls"""
+    """Render project management controls (reruns scoped to this fragment)"""
     st.subheader("📁 Project Management")
     
-    # Load existing projects list
-    existing_projects = get_existing_projects()
+    # Success message left by a load (carried over its app rerun) or a delete callback
+    action_message = st.session_state.get('project_action_message')
+    if action_message:
+        st.success(action_message)
+        st.session_state['project_action_message'] = None
+    
+    # Report a background save that failed since the last run
+    pending_save = st.session_state.get('pending_project_save')
+    if pending_save is not None and pending_save.done():
+        st.session_state['pending_project_save'] = None
+        if pending_save.exception():
+            st.error(f"❌ Error saving project: {str(pending_save.exception())}")
+    
+    # Load the newest projects; "Show more" raises the limit a page at a time
+    shown_limit = st.session_state.get('projects_shown_limit', PROJECTS_PAGE_SIZE)
+    existing_projects, total_projects = get_existing_projects(limit=shown_limit)
     
     col1, col2 = st.columns(2)
     
     with col1:
         if st.button("🆕 New Project", type="secondary"):
             create_new_project()
-            st.rerun()
+            # The rest of the app reads the cleared session
+            st.rerun(scope="app")
     
     with col2:
         if st.button("💾 Save Project", type="secondary"):
             save_current_project()
     
-    # Load existing project dropdown with delete options
+    # Projects awaiting a second ❌ click to confirm deletion
+    pending_deletes = st.session_state.get('pending_deletes', set())
+    
+    # One selectbox plus Load/Delete buttons, rather than a row of widgets per project
     if existing_projects:
-        st.markdown("**Existing Projects:**")
+        projects_by_name = {project['filename']: project for project in existing_projects}
+        selected_name = st.selectbox(
+            "**Existing Projects:**",
+            options=list(projects_by_name),
+            format_func=lambda name: projects_by_name[name]['row_label'],
+            index=None,
+            placeholder="Choose a project",
+            key="selected_project"
+        )
+        selected = projects_by_name.get(selected_name)
         
-        # Show projects in a more compact format with delete buttons
-        for project in existing_projects[:10]:  # Show only recent 10 projects
-            col_name, col_load, col_delete = st.columns([3, 1, 1])
-            
-            with col_name:
-                # Truncate long display names for better layout
-                display_name = project['display_name']
-                if len(display_name) > 40:
-                    display_name = display_name[:37] + "..."
-                st.write(f"📋 {display_name}")
-            
-            with col_load:
-                if st.button("📂", key=f"load_{project['filename']}", 
-                           help=f"Load project: {project['display_name']}"):
-                    load_project(project['filename'])
-                    st.success(f"✅ Loaded: {project['display_name'][:30]}...")
-                    st.rerun()
-            
-            with col_delete:
-                if st.button("❌", key=f"delete_{project['filename']}", 
-                           help=f"Delete project: {project['display_name']}"):
-                    # Add confirmation dialog
-                    if st.session_state.get(f'confirm_delete_{project["filename"]}'):
-                        delete_project(project['filename'])
-                        st.success(f"✅ Deleted: {project['display_name'][:30]}...")
-                        # Clear confirmation state
-                        if f'confirm_delete_{project["filename"]}' in st.session_state:
-                            del st.session_state[f'confirm_delete_{project["filename"]}']
-                        st.rerun()
-                    else:
-                        # Set confirmation state
-                        st.session_state[f'confirm_delete_{project["filename"]}'] = True
-                        st.warning(f"Click ❌ again to confirm deletion of: {project['display_name'][:30]}...")
-                        st.rerun()
+        col_load, col_delete = st.columns(2)
+        
+        with col_load:
+            if st.button("📂 Load", key="load_selected_project", disabled=selected is None,
+                         help=f"Load project: {selected['display_name']}" if selected else None):
+                load_project(selected['filename'])
+                # The rest of the app reads the loaded state
+                st.session_state['project_action_message'] = f"✅ Loaded: {selected['display_name'][:30]}..."
+                st.rerun(scope="app")
+        
+        with col_delete:
+            # Deletion runs in the click callback, before this listing is drawn, so the
+            # fragment rerun that follows already shows the updated list
+            st.button("❌ Delete", key="delete_selected_project", disabled=selected is None,
+                      help=f"Delete project: {selected['display_name']}" if selected else None,
+                      on_click=handle_delete_click,
+                      args=(selected['filename'], selected['display_name']) if selected else None)
+        
+        if selected and selected['filename'] in pending_deletes:
+            st.warning(f"Click ❌ Delete again to confirm deletion of: {selected['display_name'][:30]}...")
         
         # Show count if there are more projects
-        if len(existing_projects) > 10:
-            st.caption(f"Showing 10 of {len(existing_projects)} projects")
+        if total_projects > len(existing_projects):
+            st.caption(f"Showing {len(existing_projects)} of {total_projects} projects")
+            st.button("Show more", key="show_more_projects", on_click=show_more_projects)
         
         # Option to clear all confirmation states
-        if any(key.startswith('confirm_delete_') for key in st.session_state.keys()):
-            if st.button("🔄 Cancel All Deletions", type="secondary"):
-                # Clear all confirmation states
-                keys_to_remove = [key for key in st.session_state.keys() if key.startswith('confirm_delete_')]
-                for key in keys_to_remove:
-                    del st.session_state[key]
-                st.rerun()
+        if pending_deletes:
+            st.button("🔄 Cancel All Deletions", type="secondary", on_click=clear_all_delete_confirmations)
     
     # Show current project status
     current_project = SessionManager.get('current_project_name')
     if current_project:
-        display_current = format_project_display_name(current_project)
+        display_current = get_project_display_name(current_project)
         if len(display_current) > 50:
             display_current = display_current[:47] + "..."
         st.info(f"📋 Current: **{display_current}**")
+        
+        # Saved files are compact; the export is an indented copy for reading or sharing
+        try:
+            current_mtime = (get_projects_dir() / f"{current_project}.json").stat().st_mtime_ns
+        except OSError:
+            current_mtime = None  # not written yet, or deleted
+        if current_mtime is not None:
+            st.download_button("📤 Export Project", data=export_project_json(current_project, current_mtime),
+                               file_name=f"{current_project}.json", mime="application/json",
+                               on_click="ignore")
     else:
         st.info("📋 No project loaded")
     
     st.markdown("---")
 
+def show_more_projects():
+    """Show more button callback: list another page of saved projects"""
+    st.session_state['projects_shown_limit'] = (
+        st.session_state.get('projects_shown_limit', PROJECTS_PAGE_SIZE) + PROJECTS_PAGE_SIZE
+    )
+
+def handle_delete_click(project_name, display_name):
+    """Delete button callback: the first click asks for confirmation, the second deletes"""
+    pending_deletes = st.session_state.setdefault('pending_deletes', set())
+    if project_name in pending_deletes:
+        delete_project(project_name)
+        pending_deletes.discard(project_name)
+        st.session_state['selected_project'] = None
+        st.session_state['project_action_message'] = f"✅ Deleted: {display_name[:30]}..."
+    else:
+        pending_deletes.add(project_name)
+
 def clear_all_delete_confirmations():
     """Clear all delete confirmation states"""
-    keys_to_remove = [key for key in st.session_state.keys() if key.startswith('confirm_delete_')]
-    for key in keys_to_remove:
-        del st.session_state[key]
+    st.session_state.get('pending_deletes', set()).clear()
 
 def create_new_project():
     """Create a new project by clearing current session"""
     # Clear all session state except essential UI state
     keys_to_preserve = ['current_step']  # Add any UI state you want to preserve
     
-    new_session = {}
-    for key in keys_to_preserve:
-        if key in st.session_state:
-            new_session[key] = st.session_state[key]
+    preserved = {key: st.session_state[key] for key in keys_to_preserve if key in st.session_state}
     
     st.session_state.clear()
     
-    # Restore preserved keys
-    for key, value in new_session.items():
-        st.session_state[key] = value
-    
-    # Initialize fresh session
+    # Initialize fresh session, then restore preserved keys
     SessionManager.initialize_session()
+    st.session_state.update(preserved)
     
     # Clear current project name
     SessionManager.set('current_project_name', None)
 
+@lru_cache(maxsize=256)
 def format_project_display_name(project_name):
     """Format project name for display with timestamp parsing"""
-    try:
-        parts = project_name.split('_')
-        
-        # Find the timestamp part (starts with 4-digit year)
-        timestamp_start = None
-        for i, part in enumerate(parts):
-            if len(part) >= 4 and part[:4].isdigit():
-                timestamp_start = i
-                break
-        
-        if timestamp_start:
-            project_info = '_'.join(parts[:timestamp_start])
-            timestamp_str = '_'.join(parts[timestamp_start:])
-            
-            try:
-                timestamp = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                return f"{project_info} ({timestamp.strftime('%Y-%m-%d %H:%M:%S')})"
-            except ValueError:
-                pass
-        
-        return project_name
-        
-    except Exception:
-        return project_name
+    match = PROJECT_STEM_PATTERN.match(project_name)
+    if match:
+        try:
+            timestamp = datetime.strptime(match.group('timestamp'), "%Y%m%d_%H%M%S")
+            return f"{match.group('info')} ({timestamp.strftime('%Y-%m-%d %H:%M:%S')})"
+        except ValueError:
+            pass
+    
+    return project_name
 
 
 def save_current_project():
@@ -234,8 +340,14 @@ def save_current_project():
         st.error("❌ Cannot save: Project code and book name are required")
         return
     
+    # Collapse double-clicks: saves are timestamped to the second, so a repeat would only rewrite the same snapshot
+    if time.monotonic() - st.session_state.get('last_project_save', float('-inf')) < SAVE_DEBOUNCE_SECONDS:
+        st.info("✅ Project was just saved")
+        return
+    
     # Create filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    saved_at = datetime.now()
+    timestamp = saved_at.strftime("%Y%m%d_%H%M%S")
     base_name = f"{config['code']}_{config['book_name']}"
     project_name = f"{base_name}_{timestamp}"
     
@@ -246,83 +358,135 @@ def save_current_project():
         # Get current font case
         current_font_case = SessionManager.get_font_case()
         
-        # Collect all project data including destinations
-        project_data = {
-            'project_config': config,
-            'pdf_uploaded': SessionManager.get('pdf_uploaded', False),
-            'pdf_file_name': SessionManager.get('pdf_file').name if SessionManager.get('pdf_file') else None,
-            'total_pages': SessionManager.get('total_pages', 0),
-            'folder_structure_created': SessionManager.get('folder_structure_created', False),
-            'created_folders': SessionManager.get('created_folders', []),
-            'chapters_config': SessionManager.get('chapters_config', {}),
-            'standalone_chapters': SessionManager.get('standalone_chapters', []),  # ADD THIS LINE
-            'chapters_created': SessionManager.get('chapters_created', False),
-            'page_assignments': SessionManager.get('page_assignments', {}),  # ADD THIS LINE
-            'folder_metadata': SessionManager.get('folder_metadata', {}),
-            'unique_chapter_counter': SessionManager.get('unique_chapter_counter', 0),  # ADD THIS LINE
-            'numbering_systems': SessionManager.get('numbering_systems', {}),
-            'chapter_suffixes': SessionManager.get('chapter_suffixes', {}),
-            'extraction_history': SessionManager.get('extraction_history', []),
-            'custom_parts': SessionManager.get('custom_parts', {}),
-            'font_case_selected': True,
-            'selected_font_case': current_font_case,  # Use current font case
-            'project_destination_folder': SessionManager.get('project_destination_folder', ''),
-            'project_destination_selected': SessionManager.get('project_destination_selected', False),
-            'total_pages_generated': SessionManager.get('total_pages_generated', 0),  # ADD THIS LINE
-            'pages_calculated_timestamp': SessionManager.get('pages_calculated_timestamp', None),  # ADD THIS LINE
-            'saved_timestamp': timestamp,
-            'saved_datetime': datetime.now().isoformat()
-        }
+        # Collect all project data including destinations, then the values that need converting
+        project_data = SessionManager.snapshot(SAVED_PROJECT_DEFAULTS)
+        project_data.update(
+            pdf_file_name=SessionManager.get('pdf_file').name if SessionManager.get('pdf_file') else None,
+            extraction_history=list(project_data['extraction_history']),
+            font_case_selected=True,
+            selected_font_case=current_font_case,  # Use current font case
+        )
         
-        # Save to JSON file
-        with open(project_file, 'w') as f:
-            json.dump(project_data, f, indent=2)
+        # Encode here, while nothing else can mutate the session objects being saved. folder_metadata,
+        # usually the largest field, keeps its encoding between saves until it changes. The digest covers
+        # everything but the save timestamps, so saving again with no changes doesn't write a new snapshot
+        folder_metadata = project_data.pop('folder_metadata')
+        project_body = append_encoded_member(
+            encode_json(project_data), 'folder_metadata', get_encoded_folder_metadata(folder_metadata)
+        )
+        digest = hashlib.blake2b(project_body, digest_size=16).digest()
+        last_saved = st.session_state.get('last_saved_digest')
+        if last_saved and last_saved[0] == digest and (projects_dir / f"{last_saved[1]}.json").exists():
+            st.info("✅ No changes since the last save")
+            return
+        
+        saved_stamp = {'saved_timestamp': timestamp, 'saved_datetime': saved_at.isoformat()}
+        
+        # The project file and then the listing sidecar are written on the save thread so disk I/O
+        # doesn't block the UI
+        payloads = [
+            (project_file, extend_encoded_json(project_body, saved_stamp)),
+            (projects_dir / f"{project_name}{PROJECT_META_SUFFIX}", encode_json({
+                'code': config['code'],
+                'book_name': config['book_name'],
+                'saved_datetime': saved_stamp['saved_datetime']
+            }))
+        ]
+        st.session_state['pending_project_save'] = _save_executor.submit(write_project_files, payloads)
         
         # Update current project name
         SessionManager.set('current_project_name', project_name)
+        st.session_state['last_project_save'] = time.monotonic()
+        st.session_state['last_saved_digest'] = (digest, project_name)
         
-        # Format display name for success message
-        display_name = format_project_display_name(project_name)
+        # Format display name for success message (same format as the sidecar-based listing)
+        display_name = f"{base_name} ({saved_at.strftime('%Y-%m-%d %H:%M:%S')})"
         st.success(f"✅ Project saved as: {display_name}")
         
     except Exception as e:
         st.error(f"❌ Error saving project: {str(e)}")
 
+def encode_json(data: dict) -> bytes:
+    """Encode data as compact JSON"""
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def extend_encoded_json(body: bytes, extra: dict) -> bytes:
+    """Append extra keys to an already-encoded JSON object without encoding it again"""
+    return body[:-1] + b',' + encode_json(extra)[1:] if body != b'{}' else encode_json(extra)
+
+def append_encoded_member(body: bytes, key: str, encoded_value: bytes) -> bytes:
+    """Add a key whose value is already encoded to an encoded JSON object"""
+    member = json.dumps(key).encode('utf-8') + b':' + encoded_value
+    return body[:-1] + (b',' if body != b'{}' else b'') + member + b'}'
+
+def get_encoded_folder_metadata(folder_metadata: dict) -> bytes:
+    """folder_metadata encoded as JSON, reused until it is next written (SessionManager.set bumps its version)"""
+    version = SessionManager.get('folder_metadata_version', 0)
+    cached = st.session_state.get('folder_metadata_json')
+    if not cached or cached[0] != version:
+        cached = (version, encode_json(folder_metadata))
+        st.session_state['folder_metadata_json'] = cached
+    return cached[1]
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def export_project_json(project_name: str, mtime_ns: int) -> bytes:
+    """Indented copy of a saved project file (mtime_ns keys the cache to the file version)"""
+    with open(get_projects_dir() / f"{project_name}.json", 'rb') as f:
+        return json.dumps(json.loads(f.read()), indent=2).encode('utf-8')
+
+def write_project_files(payloads: List[Tuple[Path, bytes]]):
+    """Write each payload atomically (runs on the save thread), then refresh the listing"""
+    for path, payload in payloads:
+        write_bytes_atomic(path, payload)
+    invalidate_projects_cache()
+
+def write_bytes_atomic(path: Path, payload: bytes):
+    """Write to a temp file and move it into place, so readers never see a partial file"""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 def load_project(project_name):
     """Load project from file"""
     projects_dir = get_projects_dir()
     project_file = projects_dir / f"{project_name}.json"
     
-    if not project_file.exists():
+    try:
+        # Read raw bytes in one call and let json detect the encoding, skipping the text-mode decoder
+        with open(project_file, 'rb') as f:
+            project_data = json.loads(f.read())
+    except FileNotFoundError:
         st.error(f"❌ Project file not found: {project_name}")
         return
+    except Exception as e:
+        st.error(f"❌ Error loading project: {str(e)}")
+        return
     
     try:
-        with open(project_file, 'r') as f:
-            project_data = json.load(f)
         
         # Clear current session and load project data
         st.session_state.clear()
         SessionManager.initialize_session()
         
-        # Restore project data
-        for key, value in project_data.items():
-            if key == 'pdf_file_name':
-                # Handle PDF file separately - user will need to re-upload
-                if value:
-                    SessionManager.set('expected_pdf_name', value)
-            else:
-                SessionManager.set(key, value)
-        
-        # Set current project name
-        SessionManager.set('current_project_name', project_name)
+        # Restore project data in one update; the PDF itself is not saved, so the user will need to re-upload
+        pdf_file_name = project_data.pop('pdf_file_name', None)
+        if pdf_file_name:
+            project_data['expected_pdf_name'] = pdf_file_name
+        project_data['current_project_name'] = project_name
         
         # If PDF was previously uploaded, show message to re-upload
-        if project_data.get('pdf_uploaded') and project_data.get('pdf_file_name'):
-            st.warning(f"⚠️ Please re-upload your PDF file: {project_data['pdf_file_name']}")
+        if project_data.get('pdf_uploaded') and pdf_file_name:
+            st.warning(f"⚠️ Please re-upload your PDF file: {pdf_file_name}")
             # Reset PDF-related flags until file is re-uploaded
-            SessionManager.set('pdf_uploaded', False)
-            SessionManager.set('pdf_file', None)
+            project_data['pdf_uploaded'] = False
+            project_data['pdf_file'] = None
+        
+        SessionManager.bulk_set(project_data)
         
     except Exception as e:
         st.error(f"❌ Error loading project: {str(e)}")
@@ -330,11 +494,12 @@ def load_project(project_name):
 def delete_project(project_name):
     """Delete project file"""
     projects_dir = get_projects_dir()
-    project_file = projects_dir / f"{project_name}.json"
     
     try:
-        if project_file.exists():
-            os.remove(project_file)
+        # One unlink per file; a file that is already gone counts as deleted
+        for file_name in (f"{project_name}.json", f"{project_name}{PROJECT_META_SUFFIX}"):
+            (projects_dir / file_name).unlink(missing_ok=True)
+        invalidate_projects_cache()
         
         # If this was the current project, clear it
         if SessionManager.get('current_project_name') == project_name:
@@ -374,7 +539,10 @@ def render_pdf_upload_section():
 
 def handle_pdf_upload(uploaded_file):
     """Handle PDF file upload and processing with improved large file handling"""
-    file_size_mb = len(uploaded_file.getvalue()) / (1024 * 1024)
+    from core.pdf_handler import PDFHandler
+    
+    # UploadedFile knows its size; getvalue() would copy the whole PDF just to measure it
+    file_size_mb = uploaded_file.size / (1024 * 1024)
     
     with st.spinner(f"Loading PDF ({file_size_mb:.1f}MB)... This may take a moment for large files."):
         # Show progress for large files
@@ -442,19 +610,23 @@ def render_project_details_section():
     # Show current font formatting
     st.caption(f"Font formatting: {font_case}")
     
-    code = st.text_input(
-        "Project Code",
-        value=config.get('original_code', config.get('code', '')),
-        placeholder="e.g., CS101",
-        help=f"Short code identifier (will be formatted as: {font_case})"
-    )
-    
-    book_name = st.text_input(
-        "Book Name",
-        value=config.get('original_book_name', config.get('book_name', '')),
-        placeholder="e.g., Data Structures and Algorithms",
-        help=f"Book name (will be formatted as: {font_case}, no underscores added)"
-    )
+    # Both fields submit together, so filling them in costs one rerun instead of one per field
+    with st.form("project_details_form", border=False):
+        code = st.text_input(
+            "Project Code",
+            value=config.get('original_code', config.get('code', '')),
+            placeholder="e.g., CS101",
+            help=f"Short code identifier (will be formatted as: {font_case})"
+        )
+        
+        book_name = st.text_input(
+            "Book Name",
+            value=config.get('original_book_name', config.get('book_name', '')),
+            placeholder="e.g., Data Structures and Algorithms",
+            help=f"Book name (will be formatted as: {font_case}, no underscores added)"
+        )
+        
+        st.form_submit_button("Apply Project Details", type="secondary")
     
     if code and book_name:
         # Apply font formatting properly
@@ -473,22 +645,23 @@ def render_project_details_section():
         }
         
         # Only update if values have changed to prevent unnecessary reruns
-        current_config = SessionManager.get('project_config', {})
-        if (current_config.get('code') != formatted_code or 
-            current_config.get('book_name') != formatted_book_name or
-            current_config.get('selected_font_case') != font_case):
+        if (config.get('code') != formatted_code or 
+            config.get('book_name') != formatted_book_name or
+            config.get('selected_font_case') != font_case):
             
             SessionManager.update_config(config_updates)
         
         # Show preview with proper formatting
-        safe_code = FolderManager.sanitize_name(formatted_code)
-        preview_name = f"{safe_code}_{formatted_book_name}"
+        from core.folder_manager import FolderManager
+        
+        _, preview_name = FolderManager.get_base_name(formatted_code, formatted_book_name)
         if preview_name != f"{code}_{book_name}":
             st.info(f"Preview: `{preview_name}`")
 
 
+@st.fragment
 def render_custom_parts_configuration_section():
-    """Render custom parts configuration section with individual part creation"""
+    """Render custom parts configuration section with individual part creation (reruns scoped to this fragment)"""
     config = SessionManager.get('project_config', {})
     
     if not (config.get('code') and config.get('book_name')):
@@ -507,36 +680,35 @@ def render_custom_parts_configuration_section():
     font_case = SessionManager.get_font_case()
     st.caption(f"Font formatting: {font_case}")
     
-    # Check if we just added a part to clear the input
-    input_value = ""
-    if st.session_state.get('part_just_added'):
-        st.session_state['part_just_added'] = False
-        input_value = ""
-    else:
-        input_value = st.session_state.get('part_input_value', "")
-    
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        new_part_name = st.text_input(
-            "Part Name",
-            value=input_value,
-            placeholder="e.g., India, Iran, History, Mathematics",
-            help=f"Enter a custom name for this part (will be formatted as: {font_case})",
-            key="new_part_name_input"
-        )
-        
-        # Store the current value
-        st.session_state['part_input_value'] = new_part_name
+    # A form, so typing a name doesn't rerun anything until it is submitted
+    with st.form("add_part_form", clear_on_submit=True, border=False):
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            new_part_name = st.text_input(
+                "Part Name",
+                placeholder="e.g., India, Iran, History, Mathematics",
+                help=f"Enter a custom name for this part (will be formatted as: {font_case})",
+                key="new_part_name_input"
+            )
+        
+        with col2:
+            add_clicked = st.form_submit_button("➕ Add Part", type="primary")
+    
+    if add_clicked:
+        if new_part_name.strip():
+            formatted_name = add_custom_part(new_part_name.strip(), custom_parts, font_case)
+            st.session_state['part_action_message'] = f"Added part: '{formatted_name}'"
+            # The main page lists the parts too
+            st.rerun(scope="app")
+        else:
+            st.warning("Enter a part name first.")
     
-    with col2:
-        if st.button("➕ Add Part", type="primary", disabled=not new_part_name.strip()):
-            if new_part_name.strip():
-                add_custom_part(new_part_name.strip(), custom_parts)
-                # Set flag to clear input on next render
-                st.session_state['part_just_added'] = True
-                st.session_state['part_input_value'] = ""
-                st.rerun()
+    # Left by the last Add Part; read after the form so the app rerun above doesn't drop it
+    part_message = st.session_state.get('part_action_message')
+    if part_message:
+        st.success(part_message)
+        st.session_state['part_action_message'] = None
     
     # Display existing custom parts (READ-ONLY)
     if custom_parts:
@@ -552,33 +724,24 @@ def render_custom_parts_configuration_section():
             if original_name and original_name != formatted_name:
                 st.caption(f"Original: {original_name}")
         
-        # Update the total count in config for compatibility
-        SessionManager.update_config({'num_parts': len(custom_parts)})
-        
         st.info(f"Total parts configured: {len(custom_parts)}")
     else:
         st.info("No custom parts created yet. Add parts above to organize your book content.")
-        # Reset num_parts to 0 if no custom parts
-        SessionManager.update_config({'num_parts': 0})
+    
+    # Keep the total count in config for compatibility; only write it when it changes
+    if config.get('num_parts', 0) != len(custom_parts):
+        SessionManager.update_config({'num_parts': len(custom_parts)})
 
 
-def add_custom_part(part_name: str, custom_parts: dict):
-    """Add a new custom part with font formatting"""
+def add_custom_part(part_name: str, custom_parts: dict, font_case: str) -> str:
+    """Add a new custom part formatted in font_case and return its formatted name"""
     from core.text_formatter import TextFormatter
+    from core.chapter_utils import PartManager
     
-    font_case = SessionManager.get_font_case()
     formatted_part_name = TextFormatter.format_text(part_name, font_case)
     
     # Generate unique ID for the part using formatted name
-    base_id = formatted_part_name.lower().replace(' ', '_').replace('-', '_')
-    part_id = f"part_{len(custom_parts) + 1}_{base_id}"
-    
-    # Ensure unique ID
-    counter = 1
-    original_id = part_id
-    while part_id in custom_parts:
-        part_id = f"{original_id}_{counter}"
-        counter += 1
+    part_id = PartManager.generate_part_id(formatted_part_name, custom_parts)
     
     # Add to custom parts
     custom_parts[part_id] = {
@@ -589,7 +752,7 @@ def add_custom_part(part_name: str, custom_parts: dict):
     }
     
     SessionManager.set('custom_parts', custom_parts)
-    st.success(f"Added part: '{formatted_part_name}'")
+    return formatted_part_name
 
 
 def delete_custom_part(part_id: str, custom_parts: dict):